@@ -130,27 +130,30 @@ def load_creators(filepath: str) -> list[dict]:
     return creators
 
 
+_EMOJI_RE = re.compile(
+    "[\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map
+    "\U0001F1E0-\U0001F1FF"  # flags
+    "\U00002702-\U000027B0"
+    "\U000024C2-\U0001F251"
+    "\U0001f926-\U0001f937"
+    "\U0001F1F2-\U0001F1F4"
+    "\U0001F620-\U0001F640"
+    "\U0001F910-\U0001F9FF"
+    "]", flags=re.UNICODE
+)
+_HASHTAG_RE = re.compile(r"#\w+")
+
+
 def count_emojis(text: str) -> int:
     """Count emoji characters in text."""
-    emoji_pattern = re.compile(
-        "[\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map
-        "\U0001F1E0-\U0001F1FF"  # flags
-        "\U00002702-\U000027B0"
-        "\U000024C2-\U0001F251"
-        "\U0001f926-\U0001f937"
-        "\U0001F1F2-\U0001F1F4"
-        "\U0001F620-\U0001F640"
-        "\U0001F910-\U0001F9FF"
-        "]", flags=re.UNICODE
-    )
-    return len(emoji_pattern.findall(text))
+    return len(_EMOJI_RE.findall(text))
 
 
 def extract_hashtags(text: str) -> list[str]:
     """Extract hashtags from text."""
-    return re.findall(r"#\w+", text or "")
+    return _HASHTAG_RE.findall(text or "")
 
 
 # ─── ANALYSIS FUNCTIONS ───────────────────────────────────────────────
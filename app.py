@@ -372,9 +372,20 @@ st.session_state["sel_platforms"] = sel_platforms
 st.session_state["data_dir"] = data_dir
 
 # ── Autostrat Intelligence ───────────────────────────────────────────
-from autostrat_loader import load_all_autostrat, has_autostrat_data
+from autostrat_loader import load_all_autostrat, has_autostrat_data, autostrat_fingerprint
 
-autostrat = load_all_autostrat()
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_autostrat(autostrat_dir: str, fingerprint: str = ""):
+    # Parsed reports only change when a PDF is (re-)imported, so deserialize
+    # the JSON once per fingerprint instead of on every rerun. autostrat_dir
+    # already differs per client; max_entries evicts copies from superseded
+    # fingerprints instead of keeping them until restart.
+    return load_all_autostrat(autostrat_dir)
+
+
+autostrat = load_autostrat(cfg.autostrat_dir,
+                           fingerprint=autostrat_fingerprint(cfg.autostrat_dir))
 st.session_state["autostrat"] = autostrat
 
 # PDF import sidebar section — dev only (internal Poplife view or ?dev=1)
@@ -390,7 +401,8 @@ if show_dev_controls:
             st.sidebar.success(f"Imported {len(ok)} report(s)")
             for r in ok:
                 st.sidebar.caption(f"{r['report_type']}: {r['identifier']}")
-            autostrat = load_all_autostrat()
+            autostrat = load_autostrat(cfg.autostrat_dir,
+                                       fingerprint=autostrat_fingerprint(cfg.autostrat_dir))
             st.session_state["autostrat"] = autostrat
         if errors:
             for r in errors:
@@ -9,7 +9,13 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
+
+try:
+    # Optional fast JSON decoder; same objects as json.loads for strict JSON
+    import orjson
+except ImportError:
+    orjson = None
 
 BASE_DIR = os.path.dirname(__file__)
 _DEFAULT_AUTOSTRAT_DIR = os.path.join(BASE_DIR, "data", "cuervo", "autostrat")
@@ -40,7 +46,7 @@ def _get_reference_brands() -> list[str]:
 # Backward compat alias
 AUTOSTRAT_DIR = _DEFAULT_AUTOSTRAT_DIR
 
-REPORT_TYPES = [
+REPORT_TYPES = (
     "instagram_profiles",
     "tiktok_profiles",
     "instagram_hashtags",
@@ -48,7 +54,7 @@ REPORT_TYPES = [
     "instagram_keywords",
     "tiktok_keywords",
     "google_news",
-]
+)
 
 REPORT_TYPE_LABELS = {
     "instagram_profiles": "Instagram Profiles",
@@ -60,11 +66,28 @@ REPORT_TYPE_LABELS = {
     "google_news": "Google News",
 }
 
-# Profile report types (per-brand)
-PROFILE_TYPES = ["instagram_profiles", "tiktok_profiles"]
+# Profile report types (per-brand). Tuples keep iteration order stable;
+# use _PROFILE_TYPE_SET for membership tests.
+PROFILE_TYPES = ("instagram_profiles", "tiktok_profiles")
 
 # Conversation/trend report types (per-hashtag/keyword)
-CONVERSATION_TYPES = ["instagram_hashtags", "tiktok_hashtags", "instagram_keywords", "tiktok_keywords"]
+CONVERSATION_TYPES = ("instagram_hashtags", "tiktok_hashtags", "instagram_keywords", "tiktok_keywords")
+
+_PROFILE_TYPE_SET = frozenset(PROFILE_TYPES)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, with orjson when it is installed.
+
+    orjson rejects NaN/Infinity and lone surrogate escapes that json.loads
+    accepts, so a document it refuses is retried with json.loads.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
 
 
 def load_report(report_type: str, filename: str) -> Optional[dict]:
@@ -73,56 +96,89 @@ def load_report(report_type: str, filename: str) -> Optional[dict]:
     if not os.path.isfile(path):
         return None
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        with open(path, "rb") as f:
+            return _json_loads(f.read())
+    except (ValueError, OSError):
         return None
 
 
-def load_all_reports(report_type: str) -> dict[str, dict]:
+def load_all_reports(report_type: str, autostrat_dir: str = None) -> dict[str, dict]:
     """Load all non-template JSON files from a report type directory.
 
     Returns {identifier: report_data} where identifier is the filename stem.
     """
-    report_dir = os.path.join(_get_autostrat_dir(), report_type)
+    report_dir = os.path.join(autostrat_dir or _get_autostrat_dir(), report_type)
     if not os.path.isdir(report_dir):
         return {}
 
+    # One scandir pass (no per-file path joins), then read each file as raw
+    # bytes — the JSON decoder handles UTF-8 itself, skipping the text-mode
+    # wrapper.
+    with os.scandir(report_dir) as it:
+        entries = sorted(
+            (e for e in it if e.name.endswith(".json") and not e.name.startswith("_")),
+            key=lambda e: e.name,
+        )
+
     reports = {}
-    for filename in sorted(os.listdir(report_dir)):
-        if not filename.endswith(".json") or filename.startswith("_"):
-            continue
-        filepath = os.path.join(report_dir, filename)
+    for entry in entries:
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            identifier = os.path.splitext(filename)[0]
+            with open(entry.path, "rb") as f:
+                data = _json_loads(f.read())
+            identifier = os.path.splitext(entry.name)[0]
             reports[identifier] = data
-        except (json.JSONDecodeError, OSError):
+        except (ValueError, OSError):
             continue
 
     return reports
 
 
-def load_all_autostrat() -> dict[str, dict[str, dict]]:
+def load_all_autostrat(autostrat_dir: str = None) -> dict[str, dict[str, dict]]:
     """Load all autostrat reports across all report types.
 
     Returns {report_type: {identifier: report_data}}.
     """
+    autostrat_dir = autostrat_dir or _get_autostrat_dir()
     all_data = {}
     for rt in REPORT_TYPES:
-        all_data[rt] = load_all_reports(rt)
+        all_data[rt] = load_all_reports(rt, autostrat_dir)
     return all_data
 
 
+def autostrat_fingerprint(autostrat_dir: str = None) -> str:
+    """Return a hash of report JSON filenames + mtimes + sizes.
+
+    Used as a cache key so parsed reports are only re-read from disk when a
+    report is added, removed, or re-parsed.
+    """
+    import hashlib
+    autostrat_dir = autostrat_dir or _get_autostrat_dir()
+    entries = []
+    for rt in REPORT_TYPES:
+        report_dir = os.path.join(autostrat_dir, rt)
+        if not os.path.isdir(report_dir):
+            continue
+        for filename in sorted(os.listdir(report_dir)):
+            if not filename.endswith(".json") or filename.startswith("_"):
+                continue
+            stat = os.stat(os.path.join(report_dir, filename))
+            entries.append(f"{rt}/{filename}:{stat.st_size}:{stat.st_mtime_ns}")
+    return hashlib.md5("|".join(entries).encode()).hexdigest()
+
+
 def has_autostrat_data(autostrat: dict) -> bool:
     """Check if any autostrat reports are loaded."""
     return any(len(reports) > 0 for reports in autostrat.values())
 
 
+def _reference_brand_set() -> set[str]:
+    """Lower-cased reference brand names, built once per aggregator call."""
+    return {rb.lower() for rb in _get_reference_brands()}
+
+
 def is_reference_brand(identifier: str) -> bool:
     """Check if an autostrat profile identifier is a reference/inspiration brand."""
-    return identifier.lower() in [rb.lower() for rb in _get_reference_brands()]
+    return identifier.lower() in _reference_brand_set()
 
 
 def get_available_identifiers(autostrat: dict, report_type: str) -> list[str]:
@@ -132,8 +188,9 @@ def get_available_identifiers(autostrat: dict, report_type: str) -> list[str]:
 
 def get_competitor_identifiers(autostrat: dict, report_type: str) -> list[str]:
     """Get identifiers for a report type, excluding reference/inspiration brands."""
+    ref_brands = _reference_brand_set()
     return [i for i in get_available_identifiers(autostrat, report_type)
-            if not is_reference_brand(i)]
+            if i.lower() not in ref_brands]
 
 
 def get_reference_profiles(autostrat: dict) -> dict[str, dict]:
@@ -142,9 +199,10 @@ def get_reference_profiles(autostrat: dict) -> dict[str, dict]:
     Returns {key: {report_type, identifier, report}} across both platforms.
     """
     results = {}
+    ref_brands = _reference_brand_set()
     for rt in PROFILE_TYPES:
         for identifier, report in autostrat.get(rt, {}).items():
-            if is_reference_brand(identifier):
+            if identifier.lower() in ref_brands:
                 results[f"{rt}:{identifier}"] = {
                     "report_type": rt,
                     "identifier": identifier,
@@ -181,16 +239,20 @@ def get_all_audience_profiles(
     When exclude_reference=True, skips reference/inspiration brand profiles.
     """
     profiles = []
+    ref_brands = _reference_brand_set() if exclude_reference else set()
     for rt in REPORT_TYPES:
+        label = REPORT_TYPE_LABELS.get(rt, rt)
+        skip_refs = exclude_reference and rt in _PROFILE_TYPE_SET
         for identifier, report in autostrat.get(rt, {}).items():
-            if exclude_reference and rt in PROFILE_TYPES and is_reference_brand(identifier):
+            if skip_refs and identifier.lower() in ref_brands:
                 continue
             if "audience_profile" in report:
                 ap = report["audience_profile"]
-                if any(ap.get(k) for k in ["needs", "objections", "desires", "pain_points"]):
+                if (ap.get("needs") or ap.get("objections")
+                        or ap.get("desires") or ap.get("pain_points")):
                     profiles.append({
                         "source_type": rt,
-                        "source_label": REPORT_TYPE_LABELS.get(rt, rt),
+                        "source_label": label,
                         "identifier": identifier,
                         "audience_profile": ap,
                     })
@@ -206,56 +268,75 @@ def get_all_how_to_win(
     When exclude_reference=True, skips reference/inspiration brand profiles.
     """
     results = []
+    ref_brands = _reference_brand_set() if exclude_reference else set()
     for rt in REPORT_TYPES:
+        label = REPORT_TYPE_LABELS.get(rt, rt)
+        skip_refs = exclude_reference and rt in _PROFILE_TYPE_SET
         for identifier, report in autostrat.get(rt, {}).items():
-            if exclude_reference and rt in PROFILE_TYPES and is_reference_brand(identifier):
+            if skip_refs and identifier.lower() in ref_brands:
                 continue
             if "how_to_win" in report:
                 hw = report["how_to_win"]
                 if hw.get("territories") or hw.get("summary"):
                     results.append({
                         "source_type": rt,
-                        "source_label": REPORT_TYPE_LABELS.get(rt, rt),
+                        "source_label": label,
                         "identifier": identifier,
                         "how_to_win": hw,
                     })
     return results
 
 
-def get_all_brand_mentions(autostrat: dict) -> list[dict]:
+def get_all_brand_mentions(autostrat: dict, identifier_filter: set = None) -> list[dict]:
     """Get all brand mentions across hashtag/keyword reports.
 
+    Args:
+        autostrat: Full autostrat data dict.
+        identifier_filter: If provided, only include reports whose identifier
+            is in this set. Filtering happens per report, before any mention
+            dicts are built. Pass None to include all reports.
+
     Returns flat list of {source_type, source_identifier, brand, context, sentiment, ...}.
     """
     mentions = []
-    for rt in CONVERSATION_TYPES + ["google_news"]:
+    for rt in CONVERSATION_TYPES + ("google_news",):
+        label = REPORT_TYPE_LABELS.get(rt, rt)
         for identifier, report in autostrat.get(rt, {}).items():
+            if identifier_filter is not None and identifier not in identifier_filter:
+                continue
             for mention in report.get("brand_mentions", []):
                 mentions.append({
                     "source_type": rt,
-                    "source_label": REPORT_TYPE_LABELS.get(rt, rt),
+                    "source_label": label,
                     "source_identifier": identifier,
                     **mention,
                 })
     return mentions
 
 
-def get_all_content_trends(autostrat: dict) -> list[dict]:
-    """Get all content trends across reports.
+def iter_all_content_trends(autostrat: dict) -> Iterator[dict]:
+    """Yield content trends across reports, one at a time.
 
-    Returns list of {source_type, source_identifier, trend, description}.
+    Yields {source_type, source_label, source_identifier, trend, description}.
     """
-    trends = []
     for rt in CONVERSATION_TYPES:
+        label = REPORT_TYPE_LABELS.get(rt, rt)
         for identifier, report in autostrat.get(rt, {}).items():
             for trend in report.get("content_trends", []):
-                trends.append({
+                yield {
                     "source_type": rt,
-                    "source_label": REPORT_TYPE_LABELS.get(rt, rt),
+                    "source_label": label,
                     "source_identifier": identifier,
                     **trend,
-                })
-    return trends
+                }
+
+
+def get_all_content_trends(autostrat: dict) -> list[dict]:
+    """Get all content trends across reports.
+
+    Returns list of {source_type, source_label, source_identifier, trend, description}.
+    """
+    return list(iter_all_content_trends(autostrat))
 
 
 def get_all_creator_archetypes(autostrat: dict) -> list[dict]:
@@ -265,11 +346,12 @@ def get_all_creator_archetypes(autostrat: dict) -> list[dict]:
     """
     archetypes = []
     for rt in CONVERSATION_TYPES:
+        label = REPORT_TYPE_LABELS.get(rt, rt)
         for identifier, report in autostrat.get(rt, {}).items():
             for arch in report.get("creator_archetypes", []):
                 archetypes.append({
                     "source_type": rt,
-                    "source_label": REPORT_TYPE_LABELS.get(rt, rt),
+                    "source_label": label,
                     "source_identifier": identifier,
                     **arch,
                 })
@@ -288,15 +370,16 @@ def get_all_strategic_actions(autostrat: dict, identifier_filter: set = None) ->
     """
     results = []
     for rt in CONVERSATION_TYPES:
+        label = REPORT_TYPE_LABELS.get(rt, rt)
         for identifier, report in autostrat.get(rt, {}).items():
             if identifier_filter is not None and identifier not in identifier_filter:
                 continue
             ha = report.get("hashtag_analysis", {})
-            if any(ha.get(k) for k in ["key_findings", "opportunities",
-                                        "gaps_risks_unmet_needs", "strategic_actions"]):
+            if (ha.get("key_findings") or ha.get("opportunities")
+                    or ha.get("gaps_risks_unmet_needs") or ha.get("strategic_actions")):
                 results.append({
                     "source_type": rt,
-                    "source_label": REPORT_TYPE_LABELS.get(rt, rt),
+                    "source_label": label,
                     "source_identifier": identifier,
                     "key_findings": ha.get("key_findings", []),
                     "opportunities": ha.get("opportunities", []),
@@ -315,15 +398,17 @@ def get_all_sponsorship_suggestions(
     When exclude_reference=True, skips reference/inspiration brand profiles.
     """
     results = []
+    ref_brands = _reference_brand_set() if exclude_reference else set()
     for rt in PROFILE_TYPES:
+        label = REPORT_TYPE_LABELS.get(rt, rt)
         for identifier, report in autostrat.get(rt, {}).items():
-            if exclude_reference and is_reference_brand(identifier):
+            if identifier.lower() in ref_brands:
                 continue
             suggestions = report.get("future_sponsorship_suggestions", [])
             if suggestions:
                 results.append({
                     "source_type": rt,
-                    "source_label": REPORT_TYPE_LABELS.get(rt, rt),
+                    "source_label": label,
                     "identifier": identifier,
                     "suggestions": suggestions,
                 })
@@ -13,9 +13,25 @@ Usage:
 from __future__ import annotations
 
 import json
+import multiprocessing
 import os
 import re
 import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    # Optional libpoppler binding; avoids spawning pdftotext per file
+    import pdftotext as _pdftotext
+except ImportError:
+    _pdftotext = None
+
+try:
+    # Optional fast JSON encoder; equivalent output for the str/list/dict/int
+    # payloads the parser produces
+    import orjson
+except ImportError:
+    orjson = None
 
 BASE_DIR = os.path.dirname(__file__)
 _DEFAULT_AUTOSTRAT_DIR = os.path.join(BASE_DIR, "data", "cuervo", "autostrat")
@@ -37,6 +53,10 @@ def _get_autostrat_dir() -> str:
 AUTOSTRAT_DIR = _DEFAULT_AUTOSTRAT_DIR
 PDF_DIR = os.path.join(_DEFAULT_AUTOSTRAT_DIR, "pdfs")
 
+# parse_all_pdfs worker cap: os.cpu_count() reports the host's cores, not the
+# container's CPU quota, so a fixed small pool avoids oversubscribing it
+_MAX_PARSE_WORKERS = 4
+
 # Map title line to report type directory
 REPORT_TYPE_MAP = {
     "tiktok hashtag analysis presentation": "tiktok_hashtags",
@@ -96,16 +116,146 @@ SECTION_HEADINGS = [
     "Appendix",
 ]
 
+# ── Compiled Patterns ─────────────────────────────────────────────────
+# Every regex used by the parsers is compiled once here; call sites use the
+# pattern methods directly instead of round-tripping through re's cache.
+
+_RE_PARA = re.compile(r'\n\n+')
+_RE_LINE = re.compile(r'[^\n]+')
+_RE_ISO_DATE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_RE_LONG_DATE = re.compile(r'(\w+ \d{1,2},?\s*\d{4})')
+_RE_SECTION_HEADING = re.compile(
+    "|".join(re.escape(h) for h in sorted(SECTION_HEADINGS, key=len, reverse=True)))
+_RE_BOILERPLATE = re.compile(r'How to use this deck.*?Autostrat Team[^\n]*(?=\n)', re.S)
+_RE_NOPD_SPLIT = re.compile(r'\n(NEEDS|OBJECTIONS|DESIRES|PAIN POINTS)\n')
+_RE_NUM_LINE = re.compile(r'^[\d,]+\.?\d*\s*%?$')
+_RE_NUMBER = re.compile(r'[\d,]+\.?\d*')
+_RE_TERRITORY = re.compile(r'Territory \d+')
+_RE_SENTENCE_SPLIT = re.compile(r'(?<=\.)\s+(?=[A-Z])')
+_RE_ARCHETYPE = re.compile(r'(The [A-Z][^\n]{3,40})')
+_RE_APPEAL_SPLIT = re.compile(r'\nAppeal\n')
+_RE_CONVERSATION = re.compile(r'Conversation \d+')
+_RE_SWOT_SW_LABELS = re.compile(r'\b(?:Strengths|Weaknesses)\b')
+_RE_SWOT_OT_LABELS = re.compile(r'\b(?:Opportunities|Threats)\b')
+_RE_STATS_MARKER = re.compile(r'[\n\f]Statistics\n')
+_RE_UNSAFE_FILENAME = re.compile(r'[^\w\-]')
+
+
+def _line_heading_pattern(headings) -> re.Pattern:
+    """Compile an alternation matching any of headings as a whole line.
+
+    Surrounding spaces/tabs on the line are allowed (the parsers compare
+    stripped lines), but never a newline, so matches stay on one line.
+    """
+    alternation = "|".join(re.escape(h) for h in sorted(headings, key=len, reverse=True))
+    return re.compile(r'^[^\S\n]*(' + alternation + r')[^\S\n]*$', re.M)
+
+
+_RE_CREATOR_SUB = _line_heading_pattern([
+    "Search Purpose", "Topline", "What it Means for You", "What it Means",
+    "Common Themes and Topics", "Common Themes", "What Hits", "What Misses",
+])
+_RE_SPONSOR_SUB = _line_heading_pattern([
+    "Sponsorship Summary", "Current Categories",
+    "Integration Summary", "Current Companies",
+])
+_CONVMAP_SUB_KEYS = {
+    "Conversation Map Analysis": "summary",
+    "Relationship Analysis": "relationship_analysis",
+    "Overarching Patterns": "overarching_patterns",
+    "Conversation Action Opportunities": "action_opportunities",
+}
+_RE_CONVMAP_SUB = _line_heading_pattern(_CONVMAP_SUB_KEYS)
+_BRAND_SUB_HEADINGS = frozenset(["Context", "Reception", "Sentiment", "Verbatims"])
+
+
+def split_subsections(text: str, pattern: re.Pattern) -> list[tuple[str, str]]:
+    """Slice text at every full-line sub-heading matched by pattern.
+
+    Returns (heading, body) pairs in document order. Text before the first
+    heading is returned under the heading "preamble". Bodies are unstripped.
+    """
+    parts = []
+    heading, start = "preamble", 0
+    for m in pattern.finditer(text):
+        parts.append((heading, text[start:m.start()]))
+        heading, start = m.group(1), m.end()
+    parts.append((heading, text[start:]))
+    return parts
+
 
 def extract_text_from_pdf(pdf_path: str) -> str:
-    """Extract text from a PDF using pdftotext."""
+    """Extract text from a PDF using pdftotext.
+
+    Uses the pdftotext Python binding in-process when it is installed,
+    otherwise runs the pdftotext CLI.
+    """
+    if _pdftotext is not None:
+        with open(pdf_path, "rb") as f:
+            pages = _pdftotext.PDF(f)
+        # Match the CLI output, which ends every page with a form feed
+        return "".join(page + "\f" for page in pages)
+
+    # Ask for UTF-8 explicitly and decode it ourselves rather than relying on
+    # the locale encoding
     result = subprocess.run(
-        ["pdftotext", pdf_path, "-"],
-        capture_output=True, text=True, timeout=30
+        ["pdftotext", "-enc", "UTF-8", pdf_path, "-"],
+        capture_output=True, timeout=30
     )
     if result.returncode != 0:
-        raise RuntimeError(f"pdftotext failed on {pdf_path}: {result.stderr}")
-    return result.stdout
+        stderr = result.stderr.decode("utf-8", "replace")
+        raise RuntimeError(f"pdftotext failed on {pdf_path}: {stderr}")
+    return result.stdout.decode("utf-8", "replace")
+
+
+_PPTX_NOPD_LABELS = frozenset({"NEEDS", "OBJECTIONS", "DESIRES", "PAIN POINTS"})
+
+
+def _pptx_shape_lines(shape) -> list[str]:
+    """Extract all text lines from a single PPTX shape."""
+    lines = []
+    if shape.has_text_frame:
+        for para in shape.text_frame.paragraphs:
+            t = para.text.strip()
+            if t:
+                lines.append(t)
+    return lines
+
+
+def _pptx_table_lines(shape) -> list[str]:
+    """Extract text from a PPTX table shape with smart formatting."""
+    lines = []
+    table = shape.table
+    n_cols = len(table.columns)
+    # Read every cell once; python-pptx re-walks the XML on each access
+    rows = [[c.text.strip() for c in row.cells] for row in table.rows]
+
+    # Detect NOPD table: has rows where first cell is a NOPD label
+    is_nopd = any(cells[0] in _PPTX_NOPD_LABELS for cells in rows)
+
+    if is_nopd:
+        # Output: LABEL\n\nitem1\n\nitem2\n\nitem3\n\n (blank-line separated)
+        for cells in rows:
+            first = cells[0]
+            if first in _PPTX_NOPD_LABELS:
+                lines.append(first)
+            else:
+                # Each non-empty cell is an individual item
+                for cell in cells:
+                    if cell:
+                        lines.append(cell)
+                        lines.append("")  # blank line separator
+    elif n_cols == 2:
+        # Key-value table (stats, top posts): label then value
+        for cells in rows:
+            lines.append(cells[0])
+            lines.append(cells[1])
+    else:
+        # Multi-column table (sponsorship): each cell on its own line
+        for cells in rows:
+            lines.extend(t for t in cells if t)
+
+    return lines
 
 
 def extract_text_from_pptx(pptx_path: str) -> str:
@@ -118,63 +268,10 @@ def extract_text_from_pptx(pptx_path: str) -> str:
     from pptx import Presentation as PptxPresentation
     from pptx.enum.shapes import MSO_SHAPE_TYPE
 
-    NOPD_LABELS = {"NEEDS", "OBJECTIONS", "DESIRES", "PAIN POINTS"}
-
-    def _extract_shape_text(shape) -> list[str]:
-        """Extract all text lines from a single shape."""
-        lines = []
-        if shape.has_text_frame:
-            for para in shape.text_frame.paragraphs:
-                t = para.text.strip()
-                if t:
-                    lines.append(t)
-        return lines
-
-    def _extract_table_text(shape) -> list[str]:
-        """Extract text from a table shape with smart formatting."""
-        lines = []
-        table = shape.table
-        n_cols = len(table.columns)
-        n_rows = len(list(table.rows))
-
-        # Detect NOPD table: has rows where first cell is a NOPD label
-        is_nopd = any(
-            row.cells[0].text.strip() in NOPD_LABELS
-            for row in table.rows
-        )
-
-        if is_nopd:
-            # Output: LABEL\n\nitem1\n\nitem2\n\nitem3\n\n (blank-line separated)
-            for row in table.rows:
-                cells = [c.text.strip() for c in row.cells]
-                first = cells[0]
-                if first in NOPD_LABELS:
-                    lines.append(first)
-                else:
-                    # Each non-empty cell is an individual item
-                    for cell in cells:
-                        if cell:
-                            lines.append(cell)
-                            lines.append("")  # blank line separator
-        elif n_cols == 2:
-            # Key-value table (stats, top posts): label then value
-            for row in table.rows:
-                cells = [c.text.strip() for c in row.cells]
-                lines.append(cells[0])
-                lines.append(cells[1])
-        else:
-            # Multi-column table (sponsorship): each cell on its own line
-            for row in table.rows:
-                for cell in row.cells:
-                    t = cell.text.strip()
-                    if t:
-                        lines.append(t)
-
-        return lines
-
     # Row-clustering threshold: shapes within this vertical distance
     # are considered the same row (50000 EMU ≈ 0.55 inch).
     ROW_SNAP = 50000
+    GROUP = MSO_SHAPE_TYPE.GROUP
 
     prs = PptxPresentation(pptx_path)
     slide_blocks: list[str] = []
@@ -188,16 +285,16 @@ def extract_text_from_pptx(pptx_path: str) -> str:
             top = shape.top or 0
             left = shape.left or 0
 
-            if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+            if shape.shape_type == GROUP:
                 # Group shapes contain section headings — collect separately
                 for sub in shape.shapes:
-                    heading_lines.extend(_extract_shape_text(sub))
+                    heading_lines.extend(_pptx_shape_lines(sub))
             elif shape.has_table:
-                tlines = _extract_table_text(shape)
+                tlines = _pptx_table_lines(shape)
                 if tlines:
                     positioned.append((top, left, tlines))
             elif shape.has_text_frame:
-                tlines = _extract_shape_text(shape)
+                tlines = _pptx_shape_lines(shape)
                 if tlines:
                     positioned.append((top, left, tlines))
 
@@ -223,25 +320,19 @@ def extract_text_from_pptx(pptx_path: str) -> str:
         # For the first slide, positioned content (identifier, date) goes before
         # headings (report type title). For all other slides, headings (section
         # names) go first.
-        slide_lines: list[str] = []
-        is_first_slide = (len(slide_blocks) == 0)
-
-        if is_first_slide:
+        groups = [lines for _, _, lines in positioned]
+        if not slide_blocks:
             # Put identifier + date before report type heading
-            for _, _, lines in positioned:
-                if slide_lines and slide_lines[-1] != "":
-                    slide_lines.append("")
-                slide_lines.extend(lines)
-            if heading_lines:
-                if slide_lines and slide_lines[-1] != "":
-                    slide_lines.append("")
-                slide_lines.extend(heading_lines)
+            groups.append(heading_lines)
         else:
-            slide_lines.extend(heading_lines)
-            for _, _, lines in positioned:
-                if slide_lines and slide_lines[-1] != "":
-                    slide_lines.append("")
-                slide_lines.extend(lines)
+            groups.insert(0, heading_lines)
+
+        slide_lines: list[str] = []
+        for lines in groups:
+            # Groups that already end in a blank line (NOPD tables) need no separator
+            if lines and slide_lines and slide_lines[-1] != "":
+                slide_lines.append("")
+            slide_lines.extend(lines)
 
         slide_blocks.append("\n".join(slide_lines))
 
@@ -292,7 +383,15 @@ def detect_report_type(text: str) -> tuple[str, str, str]:
 
     Returns (report_type_dir, identifier, date_str).
     """
-    lines = [ln.strip() for ln in text.split("\n") if ln.strip()]
+    # Only the first eight non-empty lines are used, so stop scanning there
+    # instead of splitting the whole document
+    lines = []
+    for m in _RE_LINE.finditer(text):
+        line = m.group().strip()
+        if line:
+            lines.append(line)
+            if len(lines) == 8:
+                break
     if len(lines) < 3:
         raise ValueError("PDF text too short to detect report type")
 
@@ -327,11 +426,11 @@ def detect_report_type(text: str) -> tuple[str, str, str]:
     date_str = ""
     for line in lines[:8]:
         # Match "January 06, 2026" or "2025-07-04" or "December 10, 2025"
-        m = re.search(r'(\d{4}-\d{2}-\d{2})', line)
+        m = _RE_ISO_DATE.search(line)
         if m:
             date_str = m.group(1)
             break
-        m = re.search(r'(\w+ \d{1,2},?\s*\d{4})', line)
+        m = _RE_LONG_DATE.search(line)
         if m:
             date_str = m.group(1)
             break
@@ -342,41 +441,25 @@ def detect_report_type(text: str) -> tuple[str, str, str]:
 def split_into_sections(text: str) -> dict[str, str]:
     """Split text into named sections using heading delimiters."""
     sections = {}
-    # Remove the boilerplate "How to use this deck" section
-    boilerplate_end = text.find("Autostrat Team")
-    if boilerplate_end > 0:
-        # Find the next line break after boilerplate
-        next_nl = text.find("\n", boilerplate_end)
-        if next_nl > 0:
-            text = text[:text.find("How to use this deck")] + text[next_nl:]
-
-    # Build a list of (position, heading_name) for all headings found
+    # Remove the boilerplate "How to use this deck" section, up to the end of
+    # the "Autostrat Team" line
+    text = _RE_BOILERPLATE.sub("", text, count=1)
+
+    # Find every heading in one left-to-right scan. The alternation is sorted
+    # longest-first, so at each position the longest heading wins. Resuming
+    # at start + 1 (not at the match end) keeps headings that partially
+    # overlap a previous match.
     found = []
-    for heading in SECTION_HEADINGS:
-        # Use word-boundary matching to avoid partial matches
-        pattern = re.escape(heading)
-        for m in re.finditer(pattern, text):
-            found.append((m.start(), heading, m.end()))
-
-    # Sort by position
-    found.sort(key=lambda x: x[0])
-
-    # Remove substring matches: when two headings overlap (one contains the other),
-    # keep only the longer heading at that position.
-    filtered = []
-    for pos, name, end in found:
-        # Check if this match is contained within a longer heading match
-        is_substring = False
-        for opos, oname, oend in found:
-            if oname == name:
-                continue
-            # If another heading starts at same position or contains this one
-            if opos <= pos and oend >= end and len(oname) > len(name):
-                is_substring = True
-                break
-        if not is_substring:
-            filtered.append((pos, name, end))
-    found = filtered
+    max_end = -1
+    m = _RE_SECTION_HEADING.search(text)
+    while m:
+        pos, end = m.span()
+        # Drop headings contained in an earlier, longer match
+        # ("Summary Statistics" inside "Summary Statistics - All Posts").
+        if end > max_end:
+            found.append((pos, m.group(), end))
+            max_end = end
+        m = _RE_SECTION_HEADING.search(text, pos + 1)
 
     # Deduplicate — if same heading appears multiple times, keep first before Appendix
     # and any after Appendix separately
@@ -403,9 +486,16 @@ def split_into_sections(text: str) -> dict[str, str]:
     return sections
 
 
+def split_paragraphs(text: str) -> list[str]:
+    """Split text on blank lines into stripped, non-empty paragraphs."""
+    return [p for p in map(str.strip, _RE_PARA.split(text)) if p]
+
+
 def parse_number(s: str) -> int | float:
     """Parse a number string, handling commas and percentages."""
-    s = s.strip().replace(",", "").replace("%", "").strip()
+    # One strip after the replaces is enough: removing "," and "%" never
+    # adds whitespace, it can only expose it at the ends.
+    s = s.replace(",", "").replace("%", "").strip()
     try:
         if "." in s:
             return float(s)
@@ -414,31 +504,32 @@ def parse_number(s: str) -> int | float:
         return 0
 
 
+_NOPD_KEYS = {
+    "NEEDS": "needs",
+    "OBJECTIONS": "objections",
+    "DESIRES": "desires",
+    "PAIN POINTS": "pain_points",
+}
+
+
 def parse_nopd(text: str) -> dict:
     """Parse Needs/Objections/Desires/Pain Points from audience profile text."""
     result = {"summary": "", "needs": [], "objections": [], "desires": [], "pain_points": []}
 
     # Split on the NOPD labels
-    parts = re.split(r'\n(NEEDS|OBJECTIONS|DESIRES|PAIN POINTS)\n', text)
+    parts = _RE_NOPD_SPLIT.split(text)
 
     if parts:
         result["summary"] = parts[0].strip()
 
     current_key = None
-    key_map = {
-        "NEEDS": "needs",
-        "OBJECTIONS": "objections",
-        "DESIRES": "desires",
-        "PAIN POINTS": "pain_points",
-    }
-
     for part in parts[1:]:
         part = part.strip()
-        if part in key_map:
-            current_key = key_map[part]
+        if part in _NOPD_KEYS:
+            current_key = _NOPD_KEYS[part]
         elif current_key:
             # Split into individual items on double newlines or clear paragraph breaks
-            items = re.split(r'\n\n+', part)
+            items = _RE_PARA.split(part)
             for item in items:
                 item = item.strip()
                 if item and len(item) > 5:
@@ -447,6 +538,15 @@ def parse_nopd(text: str) -> dict:
     return result
 
 
+_SNAPSHOT_LABELS = {
+    "followers": "followers",
+    "following": "following",
+    "avg likes": "avg_likes",
+    "avg comments": "avg_comments",
+    "avg engagement rate": "avg_engagement_rate",
+}
+
+
 def parse_snapshot(text: str) -> dict:
     """Parse snapshot metrics (followers, following, avg likes, etc.).
 
@@ -460,39 +560,22 @@ def parse_snapshot(text: str) -> dict:
     }
 
     lines = [ln.strip() for ln in text.split("\n")]
-    LABEL_MAP = {
-        "followers": "followers",
-        "following": "following",
-        "avg likes": "avg_likes",
-        "avg comments": "avg_comments",
-        "avg engagement rate": "avg_engagement_rate",
-    }
 
-    # Find indices of each label
-    label_positions: list[tuple[int, str]] = []
+    # Sweep once, handing each numeric line to the earliest label still
+    # waiting for a value. A label only looks 12 lines ahead (PPTX text has
+    # blank lines between shapes), so expired labels are dropped first.
+    # Labels are served in order, so grouped labels followed by grouped
+    # values (PDF layout) pair up the same way as interleaved ones.
+    pending: deque[tuple[int, str]] = deque()
     for i, line in enumerate(lines):
-        low = line.lower()
-        if low in LABEL_MAP:
-            label_positions.append((i, LABEL_MAP[low]))
-
-    # For each label, find the nearest following numeric line
-    # that isn't claimed by another label closer to it.
-    # Extended range (12) handles PPTX text where blank lines separate shapes.
-    claimed: set[int] = set()
-    for pos, key in label_positions:
-        for j in range(pos + 1, min(pos + 12, len(lines))):
-            if j in claimed:
-                continue
-            line = lines[j].strip()
-            if not line:
-                continue
-            # Skip other label lines
-            if line.lower() in LABEL_MAP:
-                continue
-            if re.match(r'^[\d,]+\.?\d*\s*%?$', line):
-                snapshot[key] = parse_number(line)
-                claimed.add(j)
-                break
+        key = _SNAPSHOT_LABELS.get(line.lower())
+        if key:
+            pending.append((i, key))
+        elif pending and line and _RE_NUM_LINE.match(line):
+            while pending and i >= pending[0][0] + 12:
+                pending.popleft()
+            if pending:
+                snapshot[pending.popleft()[1]] = parse_number(line)
 
     return snapshot
 
@@ -508,29 +591,8 @@ def parse_creator_summary(text: str) -> dict:
         "what_misses": "",
     }
 
-    # Split by known sub-headings
-    sub_headings = ["Search Purpose", "Topline", "What it Means for You",
-                    "What it Means", "Common Themes and Topics",
-                    "Common Themes", "What Hits", "What Misses"]
-
-    parts = {}
-    current = "preamble"
-    current_text = []
-
-    for line in text.split("\n"):
-        stripped = line.strip()
-        matched = False
-        for heading in sub_headings:
-            if stripped == heading:
-                parts[current] = "\n".join(current_text).strip()
-                current = heading
-                current_text = []
-                matched = True
-                break
-        if not matched:
-            current_text.append(line)
-
-    parts[current] = "\n".join(current_text).strip()
+    parts = {heading: body.strip()
+             for heading, body in split_subsections(text, _RE_CREATOR_SUB)}
 
     result["search_purpose"] = parts.get("Search Purpose", "")
     result["topline"] = parts.get("Topline", parts.get("preamble", ""))
@@ -539,7 +601,7 @@ def parse_creator_summary(text: str) -> dict:
     themes_text = parts.get("Common Themes and Topics",
                             parts.get("Common Themes", ""))
     if themes_text:
-        result["common_themes"] = [t.strip() for t in re.split(r'\n\n+', themes_text)
+        result["common_themes"] = [t.strip() for t in _RE_PARA.split(themes_text)
                                    if t.strip() and len(t.strip()) > 5]
     result["what_hits"] = parts.get("What Hits", "")
     result["what_misses"] = parts.get("What Misses", "")
@@ -556,8 +618,7 @@ def parse_how_to_win(text: str) -> dict:
     result = {"summary": "", "territories": [], "audience_verbatims": []}
 
     # Split on Territory markers
-    territory_pattern = r'Territory \d+'
-    parts = re.split(territory_pattern, text)
+    parts = _RE_TERRITORY.split(text)
 
     if parts:
         first = parts[0].strip()
@@ -573,20 +634,16 @@ def parse_how_to_win(text: str) -> dict:
     for part in parts[1:]:
         part = part.strip()
         if part and len(part) > 10:
-            paras = re.split(r'\n\n+', part)
-            if paras:
-                result["territories"].append(paras[0].strip())
-
-    # Verbatims come AFTER the last territory text
-    # Find the last territory's end position, then grab everything after
-    last_territory_match = None
-    for m in re.finditer(territory_pattern, text):
-        last_territory_match = m
-
-    if last_territory_match:
-        after_last = text[last_territory_match.end():].strip()
+            # Only the first paragraph is the territory text
+            result["territories"].append(_RE_PARA.split(part, 1)[0].strip())
+
+    # Verbatims come AFTER the last territory text, i.e. in the final split
+    # part (the pattern has no groups, so parts[-1] is everything after the
+    # last marker)
+    if len(parts) > 1:
+        after_last = parts[-1].strip()
         # Skip the territory text (first paragraph) to get to verbatims
-        paras = re.split(r'\n\n+', after_last)
+        paras = _RE_PARA.split(after_last)
         # First para is the territory text; remaining are verbatims
         for para in paras[1:]:
             para = para.strip()
@@ -609,25 +666,8 @@ def parse_sponsorships(text: str) -> dict:
         "companies": [],
     }
 
-    sub_headings = ["Sponsorship Summary", "Current Categories",
-                    "Integration Summary", "Current Companies"]
-    parts = {}
-    current = "preamble"
-    current_text = []
-
-    for line in text.split("\n"):
-        stripped = line.strip()
-        matched = False
-        for heading in sub_headings:
-            if stripped == heading:
-                parts[current] = "\n".join(current_text).strip()
-                current = heading
-                current_text = []
-                matched = True
-                break
-        if not matched:
-            current_text.append(line)
-    parts[current] = "\n".join(current_text).strip()
+    parts = {heading: body.strip()
+             for heading, body in split_subsections(text, _RE_SPONSOR_SUB)}
 
     result["summary"] = parts.get("Sponsorship Summary", parts.get("preamble", ""))
     result["integration_summary"] = parts.get("Integration Summary", "")
@@ -647,6 +687,10 @@ def parse_sponsorships(text: str) -> dict:
     return result
 
 
+_WHY_LABELS = frozenset({"Why it Works", "Why it works"})
+_HOW_LABELS = frozenset({"How to Activate", "How to activate"})
+
+
 def parse_future_sponsorships(text: str) -> list[dict]:
     """Parse Future Sponsorship Suggestions from multi-column PDF layout.
 
@@ -655,13 +699,23 @@ def parse_future_sponsorships(text: str) -> list[dict]:
     "How to Activate" × N, and How text (may be interleaved or sequential).
     """
     lines_all = text.split("\n")
-    lines = [ln.strip() for ln in lines_all if ln.strip()]
 
-    # Count Why/How labels
-    why_label = {"Why it Works", "Why it works"}
-    how_label = {"How to Activate", "How to activate"}
-    why_indices = [i for i, ln in enumerate(lines) if ln in why_label]
-    how_indices = [i for i, ln in enumerate(lines) if ln in how_label]
+    # One pass: the non-empty stripped lines, each one's index in lines_all
+    # (for the raw-text lookups below), and the positions of the Why/How labels
+    lines = []
+    raw_index = []
+    why_indices = []
+    how_indices = []
+    for i, ln in enumerate(lines_all):
+        ln = ln.strip()
+        if not ln:
+            continue
+        if ln in _WHY_LABELS:
+            why_indices.append(len(lines))
+        elif ln in _HOW_LABELS:
+            how_indices.append(len(lines))
+        lines.append(ln)
+        raw_index.append(i)
 
     n_cats = max(len(why_indices), len(how_indices), 1)
 
@@ -683,21 +737,9 @@ def parse_future_sponsorships(text: str) -> list[dict]:
     # This correctly handles wrapped names like "Celebrity-Driven Cultural\nCollaborations"
     # which appear as consecutive lines without a blank line between them.
 
-    # Find summary end and first Why label in raw text (lines_all)
-    summary_end_raw = 0
-    in_summary = False
-    for i, ln in enumerate(lines_all):
-        if len(ln.strip()) > 60:
-            in_summary = True
-            summary_end_raw = i + 1
-        elif in_summary and ln.strip():
-            break
-
-    first_why_raw = len(lines_all)
-    for i, ln in enumerate(lines_all):
-        if ln.strip() in why_label:
-            first_why_raw = i
-            break
+    # Map summary end and first Why label back to raw text (lines_all)
+    summary_end_raw = raw_index[summary_end - 1] + 1 if summary_parts else 0
+    first_why_raw = raw_index[why_indices[0]] if why_indices else len(lines_all)
 
     # Parse blank-line-separated groups between summary and first Why
     groups: list[str] = []
@@ -735,7 +777,7 @@ def parse_future_sponsorships(text: str) -> list[dict]:
     why_text_lines = []
     for i in range(last_why + 1, first_how):
         ln = lines[i]
-        if ln not in why_label:
+        if ln not in _WHY_LABELS:
             why_text_lines.append(ln)
 
     why_texts = [""] * n_cats
@@ -746,19 +788,14 @@ def parse_future_sponsorships(text: str) -> list[dict]:
 
     # ── How to Activate text: after last How label ──────────────────────
     last_how = how_indices[-1] if how_indices else len(lines) - 1
-    # Use raw text (preserving blank lines) for paragraph splitting
-    # Find position of last How label in the original text
+    # Use raw text (preserving blank lines) after the last How label for
+    # paragraph splitting
     raw_after_how = ""
-    how_count = 0
-    for i, ln in enumerate(lines_all):
-        if ln.strip() in how_label:
-            how_count += 1
-            if how_count == len(how_indices):
-                raw_after_how = "\n".join(lines_all[i + 1:])
-                break
+    if how_indices:
+        raw_after_how = "\n".join(lines_all[raw_index[last_how] + 1:])
 
-    how_blocks_raw = [b.strip() for b in re.split(r'\n\n+', raw_after_how)
-                      if b.strip() and b.strip() not in how_label]
+    how_blocks_raw = [b.strip() for b in _RE_PARA.split(raw_after_how)
+                      if b.strip() and b.strip() not in _HOW_LABELS]
     # Filter out blocks from the next section (Engagement Analysis, etc.)
     how_blocks = []
     for block in how_blocks_raw:
@@ -781,7 +818,7 @@ def parse_future_sponsorships(text: str) -> list[dict]:
             for block in how_blocks:
                 for ln in block.split("\n"):
                     ln = ln.strip()
-                    if ln and ln not in how_label:
+                    if ln and ln not in _HOW_LABELS:
                         all_how_lines.append(ln)
             if all_how_lines:
                 cols = deinterleave_columns(all_how_lines, n_cats)
@@ -807,7 +844,7 @@ def parse_future_sponsorships(text: str) -> list[dict]:
 def _split_action_items(text: str) -> list[str]:
     """Split a text block into individual action items on sentence boundaries."""
     items = []
-    for sentence in re.split(r'(?<=\.)\s+(?=[A-Z])', text):
+    for sentence in _RE_SENTENCE_SPLIT.split(text):
         sentence = " ".join(sentence.split()).strip()
         if sentence and len(sentence) > 10:
             items.append(sentence)
@@ -871,7 +908,7 @@ def parse_content_trends(text: str) -> list[dict]:
     """Parse content trends section."""
     trends = []
     # Trends come as title + description paragraphs
-    paragraphs = re.split(r'\n\n+', text)
+    paragraphs = _RE_PARA.split(text)
     i = 0
     while i < len(paragraphs):
         para = paragraphs[i].strip()
@@ -904,12 +941,11 @@ def parse_creator_archetypes(text: str) -> list[dict]:
 
     # Look for "The ..." patterns as archetype names
     # Pattern: "The ASMR Mechanic", "The Relatable DIYer", etc.
-    the_pattern = r'(The [A-Z][^\n]{3,40})'
-    matches = list(re.finditer(the_pattern, text))
+    matches = list(_RE_ARCHETYPE.finditer(text))
 
     if not matches:
         # Try splitting on "Appeal" markers
-        parts = re.split(r'\nAppeal\n', text)
+        parts = _RE_APPEAL_SPLIT.split(text)
         for part in parts:
             part = part.strip()
             if part and len(part) > 20:
@@ -933,17 +969,14 @@ def parse_creator_archetypes(text: str) -> list[dict]:
 
         # Look for Appeal and Examples sub-sections
         if "Appeal" in block:
-            parts = block.split("Appeal")
+            # Only the text up to a second "Appeal" (if any) is used
+            parts = block.split("Appeal", 2)
             arch["description"] = parts[0].strip()
-            if len(parts) > 1:
-                rest = parts[1]
-                if "Examples" in rest:
-                    appeal_part, examples_part = rest.split("Examples", 1)
-                    arch["appeal"] = appeal_part.strip()
-                    arch["examples"] = [ex.strip() for ex in examples_part.strip().split("\n")
-                                        if ex.strip() and len(ex.strip()) > 5]
-                else:
-                    arch["appeal"] = rest.strip()
+            appeal_part, has_examples, examples_part = parts[1].partition("Examples")
+            arch["appeal"] = appeal_part.strip()
+            if has_examples:
+                arch["examples"] = [ex.strip() for ex in examples_part.strip().split("\n")
+                                    if ex.strip() and len(ex.strip()) > 5]
         else:
             arch["description"] = block
 
@@ -958,11 +991,10 @@ def parse_brand_mentions(text: str) -> list[dict]:
 
     # Look for brand name headers followed by context/sentiment/verbatims
     # Split on patterns like "Context\n" and "Sentiment\n"
-    sub_headings = ["Context", "Reception", "Sentiment", "Verbatims"]
 
     # First try to find brand name blocks
     current_brand = None
-    current_data = {"brand": "", "context": "", "sentiment": "", "reception": "", "verbatims": []}
+    current_data = {"brand": "", "context": [], "sentiment": [], "reception": [], "verbatims": []}
     current_field = None
 
     for line in text.split("\n"):
@@ -970,7 +1002,7 @@ def parse_brand_mentions(text: str) -> list[dict]:
         if not stripped:
             continue
 
-        if stripped in sub_headings:
+        if stripped in _BRAND_SUB_HEADINGS:
             current_field = stripped.lower()
             continue
 
@@ -978,37 +1010,51 @@ def parse_brand_mentions(text: str) -> list[dict]:
         if (len(stripped) < 30 and not stripped.endswith(".")
                 and stripped[0].isupper() and current_field is None):
             if current_brand and current_data.get("context"):
-                mentions.append(dict(current_data))
+                mentions.append(current_data)
             current_brand = stripped
-            current_data = {"brand": stripped, "context": "", "sentiment": "",
-                            "reception": "", "verbatims": []}
+            # A fresh dict per brand, so the appended one is never mutated
+            current_data = {"brand": stripped, "context": [], "sentiment": [],
+                            "reception": [], "verbatims": []}
             current_field = None
             continue
 
-        if current_field == "context":
-            current_data["context"] += " " + stripped
-        elif current_field == "sentiment":
-            current_data["sentiment"] += " " + stripped
-        elif current_field == "reception":
-            current_data["reception"] += " " + stripped
-        elif current_field == "verbatims":
-            current_data["verbatims"].append(stripped)
-        elif current_brand and not current_field:
+        # Text fields collect lines and are joined once in the clean-up below
+        if current_field:
+            current_data[current_field].append(stripped)
+        elif current_brand:
             # Probably part of the brand description
-            current_data["context"] += " " + stripped
+            current_data["context"].append(stripped)
 
     if current_brand and current_data.get("context"):
-        mentions.append(dict(current_data))
+        mentions.append(current_data)
 
     # Clean up
     for m in mentions:
-        m["context"] = m["context"].strip()
-        m["sentiment"] = m["sentiment"].strip()
-        m["reception"] = m["reception"].strip()
+        m["context"] = " ".join(m["context"])
+        m["sentiment"] = " ".join(m["sentiment"])
+        m["reception"] = " ".join(m["reception"])
 
     return mentions
 
 
+_HASHTAG_HEADING_KEYS = {
+    "Key Findings": "key_findings",
+    "Opportunities": "opportunities",
+    "Gaps, Risks or Unmet Needs": "gaps_risks_unmet_needs",
+    "Strategic Actions": "strategic_actions",
+}
+_HASHTAG_LEFT_KEYS = {
+    "Key Findings": "key_findings",
+    "Gaps, Risks or Unmet Needs": "gaps_risks_unmet_needs",
+}
+_HASHTAG_RIGHT_KEYS = {
+    "Opportunities": "opportunities",
+    "Strategic Actions": "strategic_actions",
+}
+_HASHTAG_BOUNDARIES = ("Interesting Conversations", "Content Trends",
+                       "Brand Mentions", "How to Win")
+
+
 def parse_hashtag_analysis(text: str) -> dict:
     """Parse hashtag analysis section with findings/opportunities/gaps/actions.
 
@@ -1028,8 +1074,7 @@ def parse_hashtag_analysis(text: str) -> dict:
 
     # Locate headings by position
     heading_positions = {}
-    for heading in ["Key Findings", "Opportunities",
-                    "Gaps, Risks or Unmet Needs", "Strategic Actions"]:
+    for heading in _HASHTAG_HEADING_KEYS:
         idx = text.find(heading)
         if idx >= 0:
             heading_positions[heading] = idx
@@ -1077,41 +1122,25 @@ def parse_hashtag_analysis(text: str) -> dict:
         else:
             # End at next major section or text end
             content_end = len(text)
-            for boundary in ["Interesting Conversations", "Content Trends",
-                             "Brand Mentions", "How to Win"]:
-                bpos = text.find(boundary, content_start)
-                if content_start < bpos < content_end:
+            for boundary in _HASHTAG_BOUNDARIES:
+                bpos = text.find(boundary, content_start, content_end)
+                if bpos > content_start:
                     content_end = bpos
 
         section_text = text[content_start:content_end].strip()
-        items = [item.strip() for item in re.split(r'\n\n+', section_text)
+        items = [item.strip() for item in _RE_PARA.split(section_text)
                  if item.strip() and len(item.strip()) > 10]
 
         if len(group) == 2:
             # De-interleave: even indices = left column, odd = right column
-            left_key = {
-                "Key Findings": "key_findings",
-                "Gaps, Risks or Unmet Needs": "gaps_risks_unmet_needs",
-            }.get(group[0], "key_findings")
-            right_key = {
-                "Opportunities": "opportunities",
-                "Strategic Actions": "strategic_actions",
-            }.get(group[1], "opportunities")
-
-            for idx, item in enumerate(items):
-                if idx % 2 == 0:
-                    result[left_key].append(item)
-                else:
-                    result[right_key].append(item)
+            left_key = _HASHTAG_LEFT_KEYS.get(group[0], "key_findings")
+            right_key = _HASHTAG_RIGHT_KEYS.get(group[1], "opportunities")
+
+            result[left_key].extend(items[::2])
+            result[right_key].extend(items[1::2])
         else:
             # Single heading — all items go to that key
-            key_map = {
-                "Key Findings": "key_findings",
-                "Opportunities": "opportunities",
-                "Gaps, Risks or Unmet Needs": "gaps_risks_unmet_needs",
-                "Strategic Actions": "strategic_actions",
-            }
-            key = key_map.get(group[0], "key_findings")
+            key = _HASHTAG_HEADING_KEYS.get(group[0], "key_findings")
             result[key] = items
 
     return result
@@ -1122,8 +1151,7 @@ def parse_interesting_conversations(text: str) -> list[dict]:
     conversations = []
 
     # Look for "Conversation N" patterns
-    conv_pattern = r'Conversation \d+'
-    parts = re.split(conv_pattern, text)
+    parts = _RE_CONVERSATION.split(text)
 
     # First part is the summary
     summary = parts[0].strip() if parts else ""
@@ -1152,46 +1180,19 @@ def parse_conversation_map(text: str) -> dict:
         "action_opportunities": [],
     }
 
-    sub_headings = {
-        "Conversation Map Analysis": None,
-        "Relationship Analysis": "relationship_analysis",
-        "Overarching Patterns": "overarching_patterns",
-        "Conversation Action Opportunities": "action_opportunities",
-    }
-
-    current_key = "summary"
-    current_text = []
-
-    for line in text.split("\n"):
-        stripped = line.strip()
-        matched = False
-        for heading, key in sub_headings.items():
-            if stripped == heading:
-                # Save current
-                if current_key == "summary":
-                    result["summary"] = "\n".join(current_text).strip()
-                elif current_key in ("relationship_analysis",):
-                    result[current_key] = "\n".join(current_text).strip()
-                elif current_key in ("overarching_patterns", "action_opportunities"):
-                    items = [t.strip() for t in "\n".join(current_text).strip().split("\n\n")
-                             if t.strip() and len(t.strip()) > 10]
-                    result[current_key] = items
-
-                current_key = key or "summary"
-                current_text = []
-                matched = True
-                break
-        if not matched:
-            current_text.append(line)
-
-    # Save last section
-    if current_key and current_text:
-        text_joined = "\n".join(current_text).strip()
-        if current_key in ("overarching_patterns", "action_opportunities"):
-            result[current_key] = [t.strip() for t in text_joined.split("\n\n")
-                                   if t.strip() and len(t.strip()) > 10]
-        elif current_key in result and isinstance(result.get(current_key), str):
-            result[current_key] = text_joined
+    sections = split_subsections(text, _RE_CONVMAP_SUB)
+    last = len(sections) - 1
+    for i, (heading, body) in enumerate(sections):
+        # A heading on the very last line has no body to save
+        if i == last and i and not body:
+            break
+        key = _CONVMAP_SUB_KEYS.get(heading, "summary")
+        body = body.strip()
+        if key in ("overarching_patterns", "action_opportunities"):
+            result[key] = [t.strip() for t in body.split("\n\n")
+                           if t.strip() and len(t.strip()) > 10]
+        else:
+            result[key] = body
 
     return result
 
@@ -1200,7 +1201,7 @@ def parse_in_market_campaigns(text: str) -> list[dict]:
     """Parse in-market campaigns section."""
     campaigns = []
     # Similar to content trends — title + description pairs
-    paragraphs = re.split(r'\n\n+', text)
+    paragraphs = _RE_PARA.split(text)
     i = 0
     while i < len(paragraphs):
         para = paragraphs[i].strip()
@@ -1224,13 +1225,15 @@ def parse_in_market_campaigns(text: str) -> list[dict]:
     return campaigns
 
 
-def parse_news_trends(text: str) -> list[dict]:
+def parse_news_trends(text: str, paragraphs: list[str] = None) -> list[dict]:
     """Parse News Trends section into trending narratives.
 
     PDF 2-column layout produces: [title1, title2, desc1, desc2, title3, title4, desc3, desc4].
-    Titles are short (<120 chars), descriptions are longer.
+    Titles are short (<120 chars), descriptions are longer. Pass paragraphs
+    when the caller has already split the section.
     """
-    paragraphs = [p.strip() for p in re.split(r'\n\n+', text) if p.strip()]
+    if paragraphs is None:
+        paragraphs = split_paragraphs(text)
 
     titles = []
     descriptions = []
@@ -1266,7 +1269,7 @@ def parse_news_topics(text: str) -> dict:
 
     Same 2-column layout: short topic titles, then longer finding descriptions.
     """
-    paragraphs = [p.strip() for p in re.split(r'\n\n+', text) if p.strip()]
+    paragraphs = split_paragraphs(text)
 
     topics = []
     findings = []
@@ -1291,9 +1294,7 @@ def parse_swot_overview(text: str) -> dict:
     result = {"strengths": [], "weaknesses": [], "opportunities": [], "threats": []}
 
     # Remove header labels
-    clean = text
-    clean = re.sub(r'\bStrengths\b', '', clean)
-    clean = re.sub(r'\bWeaknesses\b', '', clean)
+    clean = _RE_SWOT_SW_LABELS.sub('', text)
 
     # Find the Opportunities/Threats label line (appears at the bottom)
     lines = clean.split("\n")
@@ -1308,30 +1309,21 @@ def parse_swot_overview(text: str) -> dict:
         # Remove the label line and anything after
         clean = "\n".join(lines[:opp_label_idx])
 
-    clean = re.sub(r'\bOpportunities\b', '', clean)
-    clean = re.sub(r'\bThreats\b', '', clean)
+    clean = _RE_SWOT_OT_LABELS.sub('', clean)
 
     # Get all items as paragraphs
-    items = [p.strip() for p in re.split(r'\n\n+', clean) if p.strip() and len(p.strip()) > 20]
+    items = [p.strip() for p in _RE_PARA.split(clean) if p.strip() and len(p.strip()) > 20]
 
     # First half = S/W interleaved, second half = O/T interleaved
     half = len(items) // 2
     sw_items = items[:half]
     ot_items = items[half:]
 
-    for i, item in enumerate(sw_items):
-        c = " ".join(item.split())
-        if i % 2 == 0:
-            result["strengths"].append(c)
-        else:
-            result["weaknesses"].append(c)
-
-    for i, item in enumerate(ot_items):
-        c = " ".join(item.split())
-        if i % 2 == 0:
-            result["opportunities"].append(c)
-        else:
-            result["threats"].append(c)
+    # Even positions are the left column, odd positions the right
+    result["strengths"] = [" ".join(item.split()) for item in sw_items[::2]]
+    result["weaknesses"] = [" ".join(item.split()) for item in sw_items[1::2]]
+    result["opportunities"] = [" ".join(item.split()) for item in ot_items[::2]]
+    result["threats"] = [" ".join(item.split()) for item in ot_items[1::2]]
 
     return result
 
@@ -1339,7 +1331,7 @@ def parse_swot_overview(text: str) -> dict:
 def parse_potential_actions(text: str) -> list[str]:
     """Parse Potential Actions section into a list of action strings."""
     actions = []
-    for para in re.split(r'\n\n+', text):
+    for para in _RE_PARA.split(text):
         para = para.strip()
         if not para or len(para) < 15:
             continue
@@ -1358,7 +1350,7 @@ def parse_news_quotes(text: str) -> list[str]:
     and the next line starts a new sentence (capital letter, quote mark, or number).
     """
     # First try double-newline split
-    paras = [p.strip() for p in re.split(r'\n\n+', text) if p.strip()]
+    paras = split_paragraphs(text)
 
     quotes = []
     for para in paras:
@@ -1369,8 +1361,9 @@ def parse_news_quotes(text: str) -> list[str]:
             line = line.strip()
             if not line:
                 continue
+            # Lines in current are already stripped
             if (current and
-                    current[-1].rstrip().endswith((".","!","?",'"',"'")) and
+                    current[-1].endswith((".", "!", "?", '"', "'")) and
                     len(line) > 5 and
                     (line[0].isupper() or line[0] == '"' or line[0] == "'")):
                 # This looks like the start of a new quote
@@ -1426,31 +1419,26 @@ def parse_executive_summary(text: str) -> dict:
 
     # Look for "What You Searched" and "Why You're Searching"
     if "What You Searched" in text:
-        parts = text.split("What You Searched")
+        parts = text.split("What You Searched", 2)
         if len(parts) > 1:
             rest = parts[1]
             if "Why You're Searching" in rest:
                 search_part, purpose_part = rest.split("Why You're Searching", 1)
-                result["search_term"] = search_part.strip().split("\n")[0].strip()
-                result["search_purpose"] = purpose_part.strip().split("\n\n")[0].strip()
+                result["search_term"] = search_part.strip().split("\n", 1)[0].strip()
+                result["search_purpose"] = purpose_part.strip().split("\n\n", 1)[0].strip()
             else:
-                result["search_term"] = rest.strip().split("\n")[0].strip()
+                result["search_term"] = rest.strip().split("\n", 1)[0].strip()
 
     # Key insights are the titled blocks after the search info
-    # They appear as short title + longer description
-    paragraphs = re.split(r'\n\n+', text)
-    for para in paragraphs:
-        para = para.strip()
-        if not para:
-            continue
-        # Skip the search metadata
-        if any(x in para for x in ["What You Searched", "Why You're Searching"]):
-            continue
-        if len(para) > 30:
-            result["key_insights"].append(para)
-
-    if result["key_insights"]:
-        result["overview"] = result["key_insights"][0]
+    # They appear as short title + longer description; the first is the overview
+    insights = result["key_insights"]
+    for para in split_paragraphs(text):
+        # Skip short blocks and the search metadata
+        if (len(para) > 30 and "What You Searched" not in para
+                and "Why You're Searching" not in para):
+            if not insights:
+                result["overview"] = para
+            insights.append(para)
 
     return result
 
@@ -1462,24 +1450,21 @@ def deinterleave_columns(lines: list[str], n_cols: int) -> list[list[str]]:
     offset in the PDF grid. Pattern: partial first group (remainder columns),
     then full groups of n_cols.
     """
-    n_lines = len(lines)
-    remainder = n_lines % n_cols
-    columns: list[list[str]] = [[] for _ in range(n_cols)]
-    idx = 0
-    # Partial first group: first `remainder` columns get one extra line
+    # Column c gets line c if it is in the partial first group, then every
+    # n_cols-th line of the full groups that follow
+    remainder = len(lines) % n_cols
+    columns = [lines[remainder + col::n_cols] for col in range(n_cols)]
     for col in range(remainder):
-        if idx < n_lines:
-            columns[col].append(lines[idx])
-            idx += 1
-    # Full groups
-    while idx < n_lines:
-        for col in range(n_cols):
-            if idx < n_lines:
-                columns[col].append(lines[idx])
-                idx += 1
+        columns[col].insert(0, lines[col])
     return columns
 
 
+_POST_METRIC_LABELS = frozenset({"Caption", "Engagement Rate", "Likes Count", "Comment Count", "Link"})
+_POST_HEADER_LABELS = frozenset({"Most Liked", "Least Liked", "Most Comments", "Least Comments",
+                                 "Most Engaged", "Least Engaged"})
+_POST_FOOTNOTE_STARTS = ("All performance", "Engagement rate calculated", "Note statistics")
+
+
 def parse_top_posts_pair(text: str) -> tuple[dict, dict]:
     """Parse a 2-column Most/Least section into (most_post, least_post).
 
@@ -1490,44 +1475,40 @@ def parse_top_posts_pair(text: str) -> tuple[dict, dict]:
     most = {"caption": "", "engagement_rate": 0, "likes": 0, "comments": 0, "link": ""}
     least = {"caption": "", "engagement_rate": 0, "likes": 0, "comments": 0, "link": ""}
 
-    lines = text.split("\n")
-
-    METRIC_LABELS = {"Caption", "Engagement Rate", "Likes Count", "Comment Count", "Link"}
-    HEADER_LABELS = {"Most Liked", "Least Liked", "Most Comments", "Least Comments",
-                     "Most Engaged", "Least Engaged"}
-    FOOTNOTE_STARTS = ("All performance", "Engagement rate calculated", "Note statistics")
+    # Strip every line once up front; the scans below revisit lines
+    lines = [ln.strip() for ln in text.split("\n")]
 
     # Collect labeled sections: list of (label, [value_lines])
     label_groups: list[tuple[str, list[str]]] = []
     i = 0
     while i < len(lines):
-        stripped = lines[i].strip()
+        stripped = lines[i]
 
-        if not stripped or stripped in HEADER_LABELS:
+        if not stripped or stripped in _POST_HEADER_LABELS:
             i += 1
             continue
 
-        if any(stripped.startswith(f) for f in FOOTNOTE_STARTS):
+        if stripped.startswith(_POST_FOOTNOTE_STARTS):
             i += 1
             continue
 
-        if stripped in METRIC_LABELS:
+        if stripped in _POST_METRIC_LABELS:
             label = stripped
             value_lines = []
             j = i + 1
             while j < len(lines):
-                val = lines[j].strip()
+                val = lines[j]
                 if not val:
                     j += 1
                     continue
-                if val in METRIC_LABELS:
+                if val in _POST_METRIC_LABELS:
                     break
                 # Skip header labels (Most/Least markers) — they can appear
                 # between a metric label and its value in 2-column layouts
-                if val in HEADER_LABELS:
+                if val in _POST_HEADER_LABELS:
                     j += 1
                     continue
-                if any(val.startswith(f) for f in FOOTNOTE_STARTS):
+                if val.startswith(_POST_FOOTNOTE_STARTS):
                     break
                 value_lines.append(val)
                 # For non-Caption metrics, stop after first value line
@@ -1562,6 +1543,16 @@ def parse_top_posts_pair(text: str) -> tuple[dict, dict]:
     return most, least
 
 
+_STATISTICS_LABELS = {
+    "Min Views": "min_views", "Max Views": "max_views",
+    "Median Views": "median_views", "Avg Views": "avg_views",
+    "Min Likes": "min_likes", "Max Likes": "max_likes",
+    "Median Likes": "median_likes", "Avg Likes": "avg_likes",
+    "Min Comments": "min_comments", "Max Comments": "max_comments",
+    "Median Comments": "median_comments", "Avg Comments": "avg_comments",
+}
+
+
 def parse_statistics(text: str) -> dict:
     """Parse summary statistics section."""
     stats = {
@@ -1575,71 +1566,152 @@ def parse_statistics(text: str) -> dict:
     lines = text.split("\n")
     # Look for labeled number patterns
     for i, line in enumerate(lines):
-        stripped = line.strip()
-        label_map = {
-            "Min Views": "min_views", "Max Views": "max_views",
-            "Median Views": "median_views", "Avg Views": "avg_views",
-            "Min Likes": "min_likes", "Max Likes": "max_likes",
-            "Median Likes": "median_likes", "Avg Likes": "avg_likes",
-            "Min Comments": "min_comments", "Max Comments": "max_comments",
-            "Median Comments": "median_comments", "Avg Comments": "avg_comments",
-        }
-        for label, key in label_map.items():
-            if stripped == label:
-                for j in range(i + 1, min(i + 3, len(lines))):
-                    m = re.search(r'[\d,]+\.?\d*', lines[j])
-                    if m:
-                        stats["all_posts"][key] = parse_number(m.group())
-                        break
+        key = _STATISTICS_LABELS.get(line.strip())
+        if key is None:
+            continue
+        for j in range(i + 1, min(i + 3, len(lines))):
+            m = _RE_NUMBER.search(lines[j])
+            if m:
+                stats["all_posts"][key] = parse_number(m.group())
+                break
 
     return stats
 
 
 # ── Main Parsers per Report Type ──────────────────────────────────────
+# Each report builder fills most of its keys from a table of
+# (section heading, report key, section parser) entries, in output order.
 
-def parse_tiktok_hashtag(sections: dict, identifier: str, date_str: str) -> dict:
-    """Build JSON for a TikTok hashtag analysis report."""
-    report = {
-        "report_type": "tiktok_hashtag",
-        "hashtag": identifier,
-        "report_date": date_str,
-    }
+def _summary_block(text: str) -> dict:
+    """Store a free-text section as {"summary": ...}."""
+    return {"summary": text.strip()}
 
-    if "Executive Summary" in sections:
-        report["executive_summary"] = parse_executive_summary(sections["Executive Summary"])
 
-    if "Audience Profile" in sections:
-        report["audience_profile"] = parse_nopd(sections["Audience Profile"])
+def _verbatim_lines(text: str) -> list[str]:
+    """Verbatim is typically raw quotes — store as list of lines."""
+    # Strip each line once and drop the empty ones. Split on "\n" only;
+    # splitlines() would also break on the form feeds between pages.
+    return list(filter(None, map(str.strip, text.split("\n"))))
 
-    if "Hashtag Analysis" in sections:
-        report["hashtag_analysis"] = parse_hashtag_analysis(sections["Hashtag Analysis"])
 
-    if "Interesting Conversations" in sections:
-        convs = parse_interesting_conversations(sections["Interesting Conversations"])
-        report["interesting_conversations"] = convs
+def _parse_sections(report: dict, sections: dict, table: tuple) -> dict:
+    """Run each table entry whose section is present, in table order.
 
-    if "Conversation Map" in sections:
-        report["conversation_map"] = parse_conversation_map(sections["Conversation Map"])
+    An entry whose report key is already filled is skipped, so a later entry
+    for the same key acts as a fallback ("use X, else Y").
+    """
+    for heading, key, parser in table:
+        text = sections.get(heading)
+        if text is not None and key not in report:
+            report[key] = parser(text)
+    return report
 
-    if "Content Trends" in sections:
-        report["content_trends"] = parse_content_trends(sections["Content Trends"])
 
-    if "Brand Mentions" in sections:
-        report["brand_mentions"] = parse_brand_mentions(sections["Brand Mentions"])
+_TOP_POST_SECTIONS = (
+    ("Most / Least Liked", "most_liked", "least_liked"),
+    ("Most / Least Comments", "most_comments", "least_comments"),
+    ("Most / Least Engaged", "most_engaged", "least_engaged"),
+)
 
-    if "In-Market Campaigns" in sections:
-        report["in_market_campaigns"] = parse_in_market_campaigns(
-            sections["In-Market Campaigns"])
 
-    if "How to Win With This Audience" in sections:
-        report["how_to_win"] = parse_how_to_win(
-            sections["How to Win With This Audience"])
+def _parse_top_posts(sections: dict) -> dict:
+    """Extract both the Most and Least post from each Most / Least section."""
+    top_posts = {}
+    for heading, most_key, least_key in _TOP_POST_SECTIONS:
+        text = sections.get(heading)
+        if text is not None:
+            top_posts[most_key], top_posts[least_key] = parse_top_posts_pair(text)
+    return top_posts
+
+
+_TIKTOK_HASHTAG_SECTIONS = (
+    ("Executive Summary", "executive_summary", parse_executive_summary),
+    ("Audience Profile", "audience_profile", parse_nopd),
+    ("Hashtag Analysis", "hashtag_analysis", parse_hashtag_analysis),
+    ("Interesting Conversations", "interesting_conversations", parse_interesting_conversations),
+    ("Conversation Map", "conversation_map", parse_conversation_map),
+    ("Content Trends", "content_trends", parse_content_trends),
+    ("Brand Mentions", "brand_mentions", parse_brand_mentions),
+    ("In-Market Campaigns", "in_market_campaigns", parse_in_market_campaigns),
+    ("How to Win With This Audience", "how_to_win", parse_how_to_win),
+    ("Creator Archetypes", "creator_archetypes", parse_creator_archetypes),
+)
+
+_TIKTOK_PROFILE_SECTIONS = (
+    ("Audience Profile", "audience_profile", parse_nopd),
+    ("Snapshot", "snapshot", parse_snapshot),
+    ("Creator Summary", "creator_summary", parse_creator_summary),
+    ("Sponsorship Analysis", "sponsorships", parse_sponsorships),
+    ("Future Sponsorship Suggestions", "future_sponsorship_suggestions", parse_future_sponsorships),
+    ("Engagement Analysis", "engagement_analysis", _summary_block),
+    ("Summary Statistics", "statistics", parse_statistics),
+    ("Summary Statistics - All Posts", "statistics", parse_statistics),
+    ("Posting Analysis", "posting_analysis", _summary_block),
+    ("How to Win With This Audience", "how_to_win", parse_how_to_win),
+)
+
+_INSTAGRAM_PROFILE_SECTIONS = (
+    ("Snapshot", "snapshot", parse_snapshot),
+    ("Creator Summary", "creator_summary", parse_creator_summary),
+    ("Audience Profile", "audience_profile", parse_nopd),
+    ("Sponsorship Analysis", "sponsorships", parse_sponsorships),
+    ("Future Sponsorship Suggestions", "future_sponsorship_suggestions", parse_future_sponsorships),
+    ("Summary Statistics - All Posts", "statistics", parse_statistics),
+    ("Summary Statistics", "statistics", parse_statistics),
+    ("Engagement Analysis", "engagement_analysis", _summary_block),
+    ("Posting Analysis", "posting_analysis", _summary_block),
+    ("How to Win With This Audience", "how_to_win", parse_how_to_win),
+)
+
+# Very similar to TikTok hashtag but without conversation map and in-market campaigns
+_INSTAGRAM_HASHTAG_SECTIONS = (
+    ("Executive Summary", "executive_summary", parse_executive_summary),
+    ("Audience Profile", "audience_profile", parse_nopd),
+    ("Hashtag Analysis", "hashtag_analysis", parse_hashtag_analysis),
+    ("Conversation Map", "conversation_map", parse_conversation_map),
+    ("Content Trends", "content_trends", parse_content_trends),
+    ("Brand Mentions", "brand_mentions", parse_brand_mentions),
+    ("Creator Archetypes", "creator_archetypes", parse_creator_archetypes),
+    ("How to Win With This Audience", "how_to_win", parse_how_to_win),
+)
+
+_TIKTOK_KEYWORDS_SECTIONS = (
+    ("Executive Summary", "executive_summary", parse_executive_summary),
+    ("Audience Profile", "audience_profile", parse_nopd),
+    ("Content Trends", "content_trends", parse_content_trends),
+    ("Brand Mentions", "brand_mentions", parse_brand_mentions),
+    ("Creator Archetypes", "creator_archetypes", parse_creator_archetypes),
+    ("How to Win With This Audience", "how_to_win", parse_how_to_win),
+)
+
+_INSTAGRAM_KEYWORDS_SECTIONS = _TIKTOK_KEYWORDS_SECTIONS + (
+    ("Interesting Conversations", "interesting_conversations", parse_interesting_conversations),
+    ("In-Market Campaigns", "in_market_campaigns", parse_in_market_campaigns),
+    ("Verbatim", "verbatim", _verbatim_lines),
+)
+
+_GOOGLE_NEWS_HEAD_SECTIONS = (
+    ("Executive Summary", "executive_summary", parse_executive_summary),
+    ("Audience Profile", "audience_profile", parse_nopd),
+)
+
+_GOOGLE_NEWS_MIDDLE_SECTIONS = (
+    # Fallback for when parse_google_news found no News Trends section
+    ("Trending Narratives", "trending_narratives", parse_content_trends),
+    ("Brand Mentions", "brand_mentions", parse_brand_mentions),
+    ("In-Market Campaigns", "in_market_campaigns", parse_in_market_campaigns),
+)
 
-    if "Creator Archetypes" in sections:
-        report["creator_archetypes"] = parse_creator_archetypes(
-            sections["Creator Archetypes"])
 
-    return report
+def parse_tiktok_hashtag(sections: dict, identifier: str, date_str: str) -> dict:
+    """Build JSON for a TikTok hashtag analysis report."""
+    report = {
+        "report_type": "tiktok_hashtag",
+        "hashtag": identifier,
+        "report_date": date_str,
+    }
+
+    return _parse_sections(report, sections, _TIKTOK_HASHTAG_SECTIONS)
 
 
 def parse_tiktok_profile(sections: dict, identifier: str, date_str: str) -> dict:
@@ -1650,51 +1722,9 @@ def parse_tiktok_profile(sections: dict, identifier: str, date_str: str) -> dict
         "report_date": date_str,
     }
 
-    if "Audience Profile" in sections:
-        report["audience_profile"] = parse_nopd(sections["Audience Profile"])
-
-    if "Snapshot" in sections:
-        report["snapshot"] = parse_snapshot(sections["Snapshot"])
-
-    if "Creator Summary" in sections:
-        report["creator_summary"] = parse_creator_summary(sections["Creator Summary"])
-
-    if "Sponsorship Analysis" in sections:
-        report["sponsorships"] = parse_sponsorships(sections["Sponsorship Analysis"])
+    _parse_sections(report, sections, _TIKTOK_PROFILE_SECTIONS)
 
-    if "Future Sponsorship Suggestions" in sections:
-        report["future_sponsorship_suggestions"] = parse_future_sponsorships(
-            sections["Future Sponsorship Suggestions"])
-
-    if "Engagement Analysis" in sections:
-        report["engagement_analysis"] = {"summary": sections["Engagement Analysis"].strip()}
-
-    if "Summary Statistics" in sections:
-        report["statistics"] = parse_statistics(sections["Summary Statistics"])
-    elif "Summary Statistics - All Posts" in sections:
-        report["statistics"] = parse_statistics(sections["Summary Statistics - All Posts"])
-
-    if "Posting Analysis" in sections:
-        report["posting_analysis"] = {"summary": sections["Posting Analysis"].strip()}
-
-    if "How to Win With This Audience" in sections:
-        report["how_to_win"] = parse_how_to_win(
-            sections["How to Win With This Audience"])
-
-    # Top posts — extract both Most and Least from each section
-    top_posts = {}
-    if "Most / Least Liked" in sections:
-        m, l = parse_top_posts_pair(sections["Most / Least Liked"])
-        top_posts["most_liked"] = m
-        top_posts["least_liked"] = l
-    if "Most / Least Comments" in sections:
-        m, l = parse_top_posts_pair(sections["Most / Least Comments"])
-        top_posts["most_comments"] = m
-        top_posts["least_comments"] = l
-    if "Most / Least Engaged" in sections:
-        m, l = parse_top_posts_pair(sections["Most / Least Engaged"])
-        top_posts["most_engaged"] = m
-        top_posts["least_engaged"] = l
+    top_posts = _parse_top_posts(sections)
     if top_posts:
         report["top_posts"] = top_posts
 
@@ -1709,51 +1739,9 @@ def parse_instagram_profile(sections: dict, identifier: str, date_str: str) -> d
         "report_date": date_str,
     }
 
-    if "Snapshot" in sections:
-        report["snapshot"] = parse_snapshot(sections["Snapshot"])
+    _parse_sections(report, sections, _INSTAGRAM_PROFILE_SECTIONS)
 
-    if "Creator Summary" in sections:
-        report["creator_summary"] = parse_creator_summary(sections["Creator Summary"])
-
-    if "Audience Profile" in sections:
-        report["audience_profile"] = parse_nopd(sections["Audience Profile"])
-
-    if "Sponsorship Analysis" in sections:
-        report["sponsorships"] = parse_sponsorships(sections["Sponsorship Analysis"])
-
-    if "Future Sponsorship Suggestions" in sections:
-        report["future_sponsorship_suggestions"] = parse_future_sponsorships(
-            sections["Future Sponsorship Suggestions"])
-
-    if "Summary Statistics - All Posts" in sections:
-        report["statistics"] = parse_statistics(sections["Summary Statistics - All Posts"])
-    elif "Summary Statistics" in sections:
-        report["statistics"] = parse_statistics(sections["Summary Statistics"])
-
-    if "Engagement Analysis" in sections:
-        report["engagement_analysis"] = {"summary": sections["Engagement Analysis"].strip()}
-
-    if "Posting Analysis" in sections:
-        report["posting_analysis"] = {"summary": sections["Posting Analysis"].strip()}
-
-    if "How to Win With This Audience" in sections:
-        report["how_to_win"] = parse_how_to_win(
-            sections["How to Win With This Audience"])
-
-    # Top posts — extract both Most and Least from each section
-    top_posts = {}
-    if "Most / Least Liked" in sections:
-        m, l = parse_top_posts_pair(sections["Most / Least Liked"])
-        top_posts["most_liked"] = m
-        top_posts["least_liked"] = l
-    if "Most / Least Comments" in sections:
-        m, l = parse_top_posts_pair(sections["Most / Least Comments"])
-        top_posts["most_comments"] = m
-        top_posts["least_comments"] = l
-    if "Most / Least Engaged" in sections:
-        m, l = parse_top_posts_pair(sections["Most / Least Engaged"])
-        top_posts["most_engaged"] = m
-        top_posts["least_engaged"] = l
+    top_posts = _parse_top_posts(sections)
     if top_posts:
         report["top_posts"] = top_posts
 
@@ -1762,40 +1750,13 @@ def parse_instagram_profile(sections: dict, identifier: str, date_str: str) -> d
 
 def parse_instagram_hashtag(sections: dict, identifier: str, date_str: str) -> dict:
     """Build JSON for an Instagram hashtag analysis report."""
-    # Very similar to TikTok hashtag but without conversation map and in-market campaigns
     report = {
         "report_type": "instagram_hashtag",
         "hashtag": identifier,
         "report_date": date_str,
     }
 
-    if "Executive Summary" in sections:
-        report["executive_summary"] = parse_executive_summary(sections["Executive Summary"])
-
-    if "Audience Profile" in sections:
-        report["audience_profile"] = parse_nopd(sections["Audience Profile"])
-
-    if "Hashtag Analysis" in sections:
-        report["hashtag_analysis"] = parse_hashtag_analysis(sections["Hashtag Analysis"])
-
-    if "Conversation Map" in sections:
-        report["conversation_map"] = parse_conversation_map(sections["Conversation Map"])
-
-    if "Content Trends" in sections:
-        report["content_trends"] = parse_content_trends(sections["Content Trends"])
-
-    if "Brand Mentions" in sections:
-        report["brand_mentions"] = parse_brand_mentions(sections["Brand Mentions"])
-
-    if "Creator Archetypes" in sections:
-        report["creator_archetypes"] = parse_creator_archetypes(
-            sections["Creator Archetypes"])
-
-    if "How to Win With This Audience" in sections:
-        report["how_to_win"] = parse_how_to_win(
-            sections["How to Win With This Audience"])
-
-    return report
+    return _parse_sections(report, sections, _INSTAGRAM_HASHTAG_SECTIONS)
 
 
 def parse_tiktok_keywords(sections: dict, identifier: str, date_str: str) -> dict:
@@ -1806,27 +1767,7 @@ def parse_tiktok_keywords(sections: dict, identifier: str, date_str: str) -> dic
         "report_date": date_str,
     }
 
-    if "Executive Summary" in sections:
-        report["executive_summary"] = parse_executive_summary(sections["Executive Summary"])
-
-    if "Audience Profile" in sections:
-        report["audience_profile"] = parse_nopd(sections["Audience Profile"])
-
-    if "Content Trends" in sections:
-        report["content_trends"] = parse_content_trends(sections["Content Trends"])
-
-    if "Brand Mentions" in sections:
-        report["brand_mentions"] = parse_brand_mentions(sections["Brand Mentions"])
-
-    if "Creator Archetypes" in sections:
-        report["creator_archetypes"] = parse_creator_archetypes(
-            sections["Creator Archetypes"])
-
-    if "How to Win With This Audience" in sections:
-        report["how_to_win"] = parse_how_to_win(
-            sections["How to Win With This Audience"])
-
-    return report
+    return _parse_sections(report, sections, _TIKTOK_KEYWORDS_SECTIONS)
 
 
 def parse_instagram_keywords(sections: dict, identifier: str, date_str: str) -> dict:
@@ -1841,40 +1782,7 @@ def parse_instagram_keywords(sections: dict, identifier: str, date_str: str) ->
         "report_date": date_str,
     }
 
-    if "Executive Summary" in sections:
-        report["executive_summary"] = parse_executive_summary(sections["Executive Summary"])
-
-    if "Audience Profile" in sections:
-        report["audience_profile"] = parse_nopd(sections["Audience Profile"])
-
-    if "Content Trends" in sections:
-        report["content_trends"] = parse_content_trends(sections["Content Trends"])
-
-    if "Brand Mentions" in sections:
-        report["brand_mentions"] = parse_brand_mentions(sections["Brand Mentions"])
-
-    if "Creator Archetypes" in sections:
-        report["creator_archetypes"] = parse_creator_archetypes(
-            sections["Creator Archetypes"])
-
-    if "How to Win With This Audience" in sections:
-        report["how_to_win"] = parse_how_to_win(
-            sections["How to Win With This Audience"])
-
-    if "Interesting Conversations" in sections:
-        report["interesting_conversations"] = parse_interesting_conversations(
-            sections["Interesting Conversations"])
-
-    if "In-Market Campaigns" in sections:
-        report["in_market_campaigns"] = parse_in_market_campaigns(
-            sections["In-Market Campaigns"])
-
-    if "Verbatim" in sections:
-        # Verbatim is typically raw quotes — store as list of lines
-        raw = sections["Verbatim"].strip()
-        report["verbatim"] = [ln.strip() for ln in raw.split("\n") if ln.strip()]
-
-    return report
+    return _parse_sections(report, sections, _INSTAGRAM_KEYWORDS_SECTIONS)
 
 
 def parse_google_news(sections: dict, identifier: str, date_str: str) -> dict:
@@ -1885,13 +1793,8 @@ def parse_google_news(sections: dict, identifier: str, date_str: str) -> dict:
         "report_date": date_str,
     }
 
-    # ── Executive Summary ──────────────────────────────────────────────
-    if "Executive Summary" in sections:
-        report["executive_summary"] = parse_executive_summary(sections["Executive Summary"])
-
-    # ── Audience Profile (NOPD) ────────────────────────────────────────
-    if "Audience Profile" in sections:
-        report["audience_profile"] = parse_nopd(sections["Audience Profile"])
+    # ── Executive Summary, Audience Profile (NOPD) ─────────────────────
+    _parse_sections(report, sections, _GOOGLE_NEWS_HEAD_SECTIONS)
 
     # ── News Analysis (constructed from multiple sections) ─────────────
     news_analysis = {
@@ -1921,10 +1824,12 @@ def parse_google_news(sections: dict, identifier: str, date_str: str) -> dict:
         news_analysis["risks"] = swot.get("threats", [])
         report["swot_analysis"] = swot
 
-    # News Trends → summary for news analysis
+    # News Trends → summary for news analysis; split once, since the
+    # trending narratives below are built from the same paragraphs
+    news_trends_paras = None
     if "News Trends" in sections:
-        paragraphs = [p.strip() for p in sections["News Trends"].split("\n\n")
-                      if p.strip() and len(p.strip()) > 50]
+        news_trends_paras = split_paragraphs(sections["News Trends"])
+        paragraphs = [p for p in news_trends_paras if len(p) > 50]
         if paragraphs:
             news_analysis["summary"] = " ".join(paragraphs[0].split())
 
@@ -1937,27 +1842,17 @@ def parse_google_news(sections: dict, identifier: str, date_str: str) -> dict:
 
     report["news_analysis"] = news_analysis
 
-    # ── Trending Narratives from News Trends ───────────────────────────
-    if "News Trends" in sections:
-        report["trending_narratives"] = parse_news_trends(sections["News Trends"])
-    elif "Trending Narratives" in sections:
-        report["trending_narratives"] = parse_content_trends(sections["Trending Narratives"])
-
-    # ── Brand Mentions ─────────────────────────────────────────────────
-    if "Brand Mentions" in sections:
-        report["brand_mentions"] = parse_brand_mentions(sections["Brand Mentions"])
-
-    # ── In-Market Campaigns ────────────────────────────────────────────
-    if "In-Market Campaigns" in sections:
-        report["in_market_campaigns"] = parse_in_market_campaigns(
-            sections["In-Market Campaigns"])
+    # ── Trending Narratives, Brand Mentions, In-Market Campaigns ───────
+    if news_trends_paras is not None:
+        report["trending_narratives"] = parse_news_trends(
+            sections["News Trends"], news_trends_paras)
+    _parse_sections(report, sections, _GOOGLE_NEWS_MIDDLE_SECTIONS)
 
     # ── Strategic Implications (from Consideration Spaces + Actions) ───
     strat = {"summary": "", "action_items": []}
     if "Consideration Spaces" in sections:
         # Extract overview paragraph (first long paragraph)
-        paras = [p.strip() for p in re.split(r'\n\n+', sections["Consideration Spaces"])
-                 if p.strip()]
+        paras = split_paragraphs(sections["Consideration Spaces"])
         long_paras = [p for p in paras if len(p) > 100]
         short_paras = [" ".join(p.split()) for p in paras if 20 < len(p) <= 100]
         if long_paras:
@@ -1979,7 +1874,7 @@ def parse_google_news(sections: dict, identifier: str, date_str: str) -> dict:
     if "Quotes" in sections:
         quotes_text = sections["Quotes"]
         # Statistics may be embedded after Quotes (with form-feed or newline before it)
-        stats_match = re.search(r'[\n\f]Statistics\n', quotes_text)
+        stats_match = _RE_STATS_MARKER.search(quotes_text)
         if stats_match:
             report["quotes"] = parse_news_quotes(quotes_text[:stats_match.start()])
             report["key_statistics"] = parse_news_statistics(
@@ -1990,7 +1885,7 @@ def parse_google_news(sections: dict, identifier: str, date_str: str) -> dict:
     # ── Top Stories (if present as a section) ──────────────────────────
     if "Top Stories" in sections:
         stories = []
-        for para in re.split(r'\n\n+', sections["Top Stories"]):
+        for para in _RE_PARA.split(sections["Top Stories"]):
             para = para.strip()
             if para and len(para) > 30:
                 stories.append({
@@ -2044,67 +1939,161 @@ def parse_pdf(pdf_path: str) -> tuple[str, str, dict]:
     return report_type_dir, identifier, report
 
 
+def _save_report(report_type_dir: str, identifier: str, report: dict,
+                 autostrat_dir: str, made_dirs: set = None) -> str:
+    """Write a parsed report to {autostrat_dir}/{report_type_dir}/ and return its path.
+
+    Pass the same made_dirs set across a batch so each output directory is
+    only created once.
+    """
+    safe_name = _RE_UNSAFE_FILENAME.sub('_', identifier.lower()).strip('_')
+    output_dir = os.path.join(autostrat_dir, report_type_dir)
+    if made_dirs is None or output_dir not in made_dirs:
+        os.makedirs(output_dir, exist_ok=True)
+        if made_dirs is not None:
+            made_dirs.add(output_dir)
+    output_path = os.path.join(output_dir, f"{safe_name}.json")
+
+    # Encode first, then write once: json.dump would issue a write() per
+    # token and leave a truncated file behind if encoding failed
+    data = None
+    if orjson is not None:
+        try:
+            data = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson.JSONEncodeError subclasses TypeError; json is more lenient
+            # (e.g. non-str dict keys, ints beyond 64 bits)
+            data = None
+    if data is None:
+        data = json.dumps(report, indent=2, ensure_ascii=False).encode("utf-8")
+    with open(output_path, "wb") as f:
+        f.write(data)
+
+    return output_path
+
+
 def parse_and_save_pdf(pdf_path: str) -> str:
     """Parse a PDF and save the JSON output to the correct directory.
 
     Returns the output JSON file path.
     """
     report_type_dir, identifier, report = parse_pdf(pdf_path)
+    return _save_report(report_type_dir, identifier, report, _get_autostrat_dir())
 
-    # Create safe filename from identifier
-    safe_name = re.sub(r'[^\w\-]', '_', identifier.lower()).strip('_')
-    autostrat_dir = _get_autostrat_dir()
-    output_dir = os.path.join(autostrat_dir, report_type_dir)
-    os.makedirs(output_dir, exist_ok=True)
-    output_path = os.path.join(output_dir, f"{safe_name}.json")
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+def parse_one_pdf(pdf_path: str) -> tuple[str | None, str | None, dict | None, str | None]:
+    """Parse a single file, catching errors so it can run in a worker process.
 
-    return output_path
+    Returns (report_type_dir, identifier, report_dict, error).
+    """
+    try:
+        report_type_dir, identifier, report = parse_pdf(pdf_path)
+    except Exception as e:
+        return None, None, None, str(e)
+    return report_type_dir, identifier, report, None
+
+
+def _load_parse_cache(cache_path: str) -> dict:
+    """Load the parse_all_pdfs side-cache, or an empty one if missing/stale."""
+    try:
+        with open(cache_path, "rb") as f:
+            cache = json.loads(f.read())
+    except (ValueError, OSError):
+        return {}
+    # Reports parsed by an older version of this module are re-parsed
+    if cache.get("parser_mtime_ns") != os.stat(__file__).st_mtime_ns:
+        return {}
+    return cache.get("files", {})
+
+
+def _save_parse_cache(cache_path: str, files: dict) -> None:
+    """Atomically write the parse_all_pdfs side-cache."""
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"parser_mtime_ns": os.stat(__file__).st_mtime_ns, "files": files}, f)
+    os.replace(tmp_path, cache_path)
 
 
 def parse_all_pdfs(pdf_dir: str = None) -> list[dict]:
     """Parse all PDFs in the given directory.
 
+    Files whose mtime and size match {autostrat_dir}/.parse_cache.json (and
+    whose JSON output still exists) are skipped. The rest are parsed in up to
+    _MAX_PARSE_WORKERS spawned worker processes (a single file is parsed
+    in-process); the JSON output is written from this process so it lands in
+    the active client's autostrat directory.
+
     Returns list of {pdf: str, output: str, report_type: str, identifier: str, error: str|None}.
     """
+    autostrat_dir = _get_autostrat_dir()
     if pdf_dir is None:
-        pdf_dir = os.path.join(_get_autostrat_dir(), "pdfs")
+        pdf_dir = os.path.join(autostrat_dir, "pdfs")
 
     if not os.path.isdir(pdf_dir):
         return []
 
-    results = []
+    cache_path = os.path.join(autostrat_dir, ".parse_cache.json")
+    cache = _load_parse_cache(cache_path)
+
+    results = {}
+    stamps = {}
+    to_parse = []
     for filename in sorted(os.listdir(pdf_dir)):
-        if not (filename.lower().endswith(".pdf") or filename.lower().endswith(".pptx")):
+        if not filename.lower().endswith((".pdf", ".pptx")):
             continue
-
         pdf_path = os.path.join(pdf_dir, filename)
-        try:
-            report_type_dir, identifier, report = parse_pdf(pdf_path)
-            safe_name = re.sub(r'[^\w\-]', '_', identifier.lower()).strip('_')
-            output_dir = os.path.join(_get_autostrat_dir(), report_type_dir)
-            os.makedirs(output_dir, exist_ok=True)
-            output_path = os.path.join(output_dir, f"{safe_name}.json")
-
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
-
-            results.append({
-                "pdf": filename,
+        st = os.stat(pdf_path)
+        stamps[pdf_path] = [st.st_mtime_ns, st.st_size]
+        entry = cache.get(pdf_path)
+        if (entry and entry["stamp"] == stamps[pdf_path]
+                and os.path.isfile(entry["result"]["output"])):
+            results[pdf_path] = entry["result"]
+        else:
+            results[pdf_path] = None
+            to_parse.append(pdf_path)
+
+    if len(to_parse) > 1:
+        workers = min(len(to_parse), _MAX_PARSE_WORKERS, os.cpu_count() or 1)
+        # Spawn, not fork: this runs inside Streamlit's multithreaded server,
+        # and a forked child can deadlock on locks held by other threads
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as ex:
+            parsed = list(ex.map(parse_one_pdf, to_parse))
+    else:
+        parsed = [parse_one_pdf(p) for p in to_parse]
+
+    made_dirs = set()
+    for pdf_path, (report_type_dir, identifier, report, error) in zip(to_parse, parsed):
+        if error is None:
+            try:
+                output_path = _save_report(report_type_dir, identifier, report,
+                                           autostrat_dir, made_dirs)
+            except Exception as e:
+                error = str(e)
+        if error is None:
+            results[pdf_path] = {
+                "pdf": os.path.basename(pdf_path),
                 "output": output_path,
                 "report_type": report_type_dir,
                 "identifier": identifier,
                 "error": None,
-            })
-        except Exception as e:
-            results.append({
-                "pdf": filename,
+            }
+        else:
+            results[pdf_path] = {
+                "pdf": os.path.basename(pdf_path),
                 "output": None,
                 "report_type": None,
                 "identifier": None,
-                "error": str(e),
-            })
+                "error": error,
+            }
+
+    if to_parse:
+        # Only successful parses are cached; failures are retried next run
+        files = {path: {"stamp": stamps[path], "result": r}
+                 for path, r in results.items() if r["error"] is None}
+        try:
+            _save_parse_cache(cache_path, files)
+        except OSError:
+            pass
 
-    return results
+    return list(results.values())
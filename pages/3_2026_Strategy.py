@@ -4,6 +4,7 @@ Dedicated to the Social Brief. Uses unfiltered data — sidebar filters do NOT a
 """
 
 import sys, os
+from itertools import islice
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import pandas as pd
@@ -15,7 +16,7 @@ from config import CHART_TEMPLATE, CHART_FONT, PRIORITY_COLORS, COLLAB_AMPLIFIED
 from client_context import get_client
 from autostrat_loader import (
     has_autostrat_data, get_all_how_to_win, get_all_audience_profiles,
-    get_all_content_trends, get_all_creator_archetypes,
+    iter_all_content_trends, get_all_creator_archetypes,
     get_all_strategic_actions, get_all_sponsorship_suggestions,
 )
 from autostrat_components import (
@@ -1095,11 +1096,12 @@ with tab_action:
             st.markdown("---")
 
         # Content Trends
-        all_trends = get_all_content_trends(autostrat)
+        # Only the first 6 trends are rendered — don't build the rest
+        all_trends = list(islice(iter_all_content_trends(autostrat), 6))
         if all_trends:
             render_kpi_section_label("Content trends")
             cols = st.columns(2)
-            for i, trend in enumerate(all_trends[:6]):
+            for i, trend in enumerate(all_trends):
                 with cols[i % 2]:
                     render_narrative_card(trend.get("trend", f"Trend {i+1}"),
                                          trend.get("description", ""), accent_color="#F8C090")
@@ -38,9 +38,8 @@ st.markdown(cfg.custom_css, unsafe_allow_html=True)
 brand_ht_map = get_brand_hashtag_reports(autostrat)
 category_reports = get_category_reports(autostrat)
 news_reports = autostrat.get("google_news", {})
-_all_mentions_raw = get_all_brand_mentions(autostrat)
 _allowed_ids = set(cfg.brand_hashtags) | set(cfg.category_hashtags) | set(autostrat.get("google_news", {}).keys())
-all_mentions = [m for m in _all_mentions_raw if m.get("source_identifier") in _allowed_ids]
+all_mentions = get_all_brand_mentions(autostrat, identifier_filter=_allowed_ids)
 
 has_brand_data = len(brand_ht_map) > 0
 has_category_data = len(category_reports) > 0
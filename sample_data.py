@@ -17,6 +17,13 @@ from templates import (
 
 random.seed(42)
 
+_HASHTAG_RE = re.compile(r"#\w+")
+_EMOJI_RE = re.compile(
+    "[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF"
+    "\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U000024C2-\U0001F251"
+    "\U0001f926-\U0001f937\U0001F1F2-\U0001F1F4\U0001F620-\U0001F640"
+    "\U0001F910-\U0001F9FF]")
+
 # ─── BRAND PERSONALITY PROFILES ───────────────────────────────────────
 # Follower counts and strategies based on real social media research (Feb 2026).
 # Posts-per-month values are inflated above real-world rates to generate
@@ -510,14 +517,10 @@ def generate_sample_posts(output_dir: str) -> str:
 
                 # Caption
                 caption = _generate_caption(brand, theme)
-                hashtags = " ".join(re.findall(r"#\w+", caption))
+                hashtags = " ".join(_HASHTAG_RE.findall(caption))
 
                 word_count = len(caption.split())
-                emoji_count = len(re.findall(
-                    "[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF"
-                    "\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U000024C2-\U0001F251"
-                    "\U0001f926-\U0001f937\U0001F1F2-\U0001F1F4\U0001F620-\U0001F640"
-                    "\U0001F910-\U0001F9FF]", caption))
+                emoji_count = len(_EMOJI_RE.findall(caption))
 
                 # Tone
                 tone = random.choice(profile["tone_bias"])
@@ -16,6 +16,15 @@ import re
 from datetime import datetime
 from typing import Optional
 
+_MENTION_RE = re.compile(r"@[\w.]+")
+_HASHTAG_RE = re.compile(r"#\w+")
+_EMOJI_RE = re.compile(
+    "[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF"
+    "\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U000024C2-\U0001F251"
+    "\U0001f926-\U0001f937\U0001F1F2-\U0001F1F4\U0001F620-\U0001F640"
+    "\U0001F910-\U0001F9FF]")
+_BENCHMARK_RANGE_RE = re.compile(r"(\d{1,2})-(\w+)_to_(\d{1,2})-(\w+)")
+
 # ─── BRAND NAME MAPPING ──────────────────────────────────────────────
 # Maps Sprout Social profile names/handles to our canonical brand names.
 # Loaded from client config when available, with fallback to legacy mapping.
@@ -379,7 +388,7 @@ def detect_creator_collab(caption: str, brand_handle: str = "") -> tuple[bool, s
     """Detect creator collaboration and extract handle from caption."""
     if not caption:
         return False, ""
-    mentions = re.findall(r"@[\w.]+", caption)
+    mentions = _MENTION_RE.findall(caption)
     brand_clean = brand_handle.replace("@", "").lower()
     other_mentions = [m for m in mentions if m.replace("@", "").lower() != brand_clean]
     text = caption.lower()
@@ -410,17 +419,13 @@ def detect_paid_partnership(caption: str) -> bool:
 
 
 def _extract_hashtags(caption: str) -> str:
-    return " ".join(re.findall(r"#\w+", caption)) if caption else ""
+    return " ".join(_HASHTAG_RE.findall(caption)) if caption else ""
 
 
 def _count_emojis(text: str) -> int:
     if not text:
         return 0
-    return len(re.findall(
-        "[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF"
-        "\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U000024C2-\U0001F251"
-        "\U0001f926-\U0001f937\U0001F1F2-\U0001F1F4\U0001F620-\U0001F640"
-        "\U0001F910-\U0001F9FF]", text))
+    return len(_EMOJI_RE.findall(text))
 
 
 # ─── MAIN IMPORT FUNCTIONS ───────────────────────────────────────────
@@ -512,7 +517,7 @@ def import_sprout_posts(csv_path: str) -> list[dict]:
         has_music = "Yes" if post_type in ("Reel", "Video") else "No"
         word_count = len(caption.split()) if caption else 0
         emoji_count = _count_emojis(caption)
-        mentions_count = len(re.findall(r"@[\w.]+", caption)) if caption else 0
+        mentions_count = len(_MENTION_RE.findall(caption)) if caption else 0
 
         rows.append({
             "brand": brand,
@@ -699,7 +704,7 @@ def import_benchmark_csv(csv_path: str) -> dict:
     # Parse date range from filename: Benchmark_CSV_ig_..._20-Jan_to_17-Feb.csv
     date_range = ""
     fname = os.path.basename(csv_path)
-    m = re.search(r"(\d{1,2})-(\w+)_to_(\d{1,2})-(\w+)", fname)
+    m = _BENCHMARK_RANGE_RE.search(fname)
     if m:
         date_range = f"{m.group(2)} {m.group(1)} – {m.group(4)} {m.group(3)}"
 